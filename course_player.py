@@ -5,27 +5,70 @@ Recursively scans for video files and creates an interactive LMS-style player.
 """
 
 import os
+import atexit
 import json
 import re
 import http.server
-import socketserver
 import webbrowser
 import threading
-from pathlib import Path
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from urllib.parse import quote, unquote, parse_qs, urlparse
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding when installed
+except ImportError:
+    orjson = None
+
 # Configuration
 PORT = 8000
 VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.webm')
 SUBTITLE_EXTENSIONS = ('.srt', '.vtt')
 PROGRESS_FILE = 'progress.json'
+SCAN_CACHE_FILE = '.scan_cache.json'
+MINIFY_CSS = True  # Set to False to serve the stylesheet as written
+PROGRESS_SAVE_DELAY = 1.0  # Seconds to wait for more changes before writing progress.json
+
+# Set versions of the extension lists, for O(1) lookups while scanning
+_VIDEO_EXTS = frozenset(VIDEO_EXTENSIONS)
+# Subtitle extension -> preference rank (earlier in SUBTITLE_EXTENSIONS wins)
+_SUBTITLE_RANK = {ext: rank for rank, ext in enumerate(SUBTITLE_EXTENSIONS)}
+
+# Matches digit runs inside names
+_NAT_RE = re.compile(r'\d+')
+
+def _encode_digits(match):
+    # '\0' ends the text before the number, so shorter text sorts first;
+    # the length prefix makes longer numbers sort after shorter ones
+    digits = match.group(0).lstrip('0')
+    return '\0' + chr(len(digits)) + digits
 
 def natural_sort_key(s):
     """
     Sort strings naturally (e.g., '2' before '10').
+    Returns a single lowercase string that orders exactly like the list of
+    alternating text / number tokens, so comparing two keys is one plain
+    string comparison.
+    """
+    return _NAT_RE.sub(_encode_digits, s.lower()) + '\0'
+
+def json_dumps(obj):
+    """
+    Serialize obj to a compact JSON string, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+def json_loads(data):
+    """
+    Parse a JSON string, using orjson when available.
     """
-    return [int(text) if text.isdigit() else text.lower()
-            for text in re.split(r'(\d+)', str(s))]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 def load_progress():
     """
@@ -37,89 +80,398 @@ def load_progress():
     
     try:
         with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = json_loads(f.read())
             return data.get('watched', [])
     except Exception as e:
         print(f"Error loading progress: {e}")
         return []
 
+# In-memory set of watched video paths, loaded from progress.json on first use
+_WATCHED = None
+# Bumped on every change to _WATCHED (used to invalidate the cached page)
+_WATCHED_VERSION = 0
+# Guards _WATCHED and progress.json: requests are handled on several threads
+_PROGRESS_LOCK = threading.RLock()
+# Pending write of progress.json, restarted by every change (see _write_progress)
+_SAVE_TIMER = None
+
+def get_watched():
+    """
+    Return the set of watched video paths, reading progress.json only once.
+    Callers that iterate or mutate the set must hold _PROGRESS_LOCK.
+    """
+    global _WATCHED
+    with _PROGRESS_LOCK:
+        if _WATCHED is None:
+            _WATCHED = set(load_progress())
+        return _WATCHED
+
+def _write_progress():
+    """
+    Record a change to the watched set and schedule saving it.
+    A burst of changes (e.g. marking several videos in a row) is written to
+    progress.json once, PROGRESS_SAVE_DELAY seconds after the last one.
+    Must be called with _PROGRESS_LOCK held.
+    """
+    global _WATCHED_VERSION, _SAVE_TIMER
+    _WATCHED_VERSION += 1
+    if _SAVE_TIMER is not None:
+        _SAVE_TIMER.cancel()
+    _SAVE_TIMER = threading.Timer(PROGRESS_SAVE_DELAY, flush_progress)
+    _SAVE_TIMER.daemon = True
+    _SAVE_TIMER.start()
+
+@atexit.register
+def flush_progress():
+    """
+    Write pending progress changes to progress.json now.
+    Also runs at interpreter exit, so a change made just before the server
+    stops is not lost.
+    """
+    global _SAVE_TIMER
+    with _PROGRESS_LOCK:
+        if _SAVE_TIMER is None:
+            return
+        _SAVE_TIMER.cancel()
+        _SAVE_TIMER = None
+
+        try:
+            # Serialize first and write once: json.dump() issues a write per token
+            data = json_dumps({'watched': sorted(get_watched())})
+            with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
+                f.write(data)
+        except Exception as e:
+            print(f"Error saving progress: {e}")
+
+def is_watched(video_path):
+    """
+    Check whether a video path is marked as watched.
+    """
+    return video_path.replace('\\', '/') in get_watched()
+
 def save_progress(video_path):
     """
     Add a video path to the watched list and save to progress.json.
     """
-    watched = load_progress()
-    
     # Normalize path for comparison
     normalized_path = video_path.replace('\\', '/')
     
-    if normalized_path not in watched:
-        watched.append(normalized_path)
-        
-        try:
-            with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-                json.dump({'watched': watched}, f, indent=2)
-            print(f"✓ Marked as watched: {video_path}")
-        except Exception as e:
-            print(f"Error saving progress: {e}")
+    with _PROGRESS_LOCK:
+        watched = get_watched()
+        if normalized_path in watched:
+            return
+        watched.add(normalized_path)
+        _write_progress()
+        print(f"✓ Marked as watched: {video_path}")
 
 def remove_progress(video_path):
     """
     Remove a video path from the watched list and save to progress.json.
     """
-    watched = load_progress()
-    
     # Normalize path for comparison
     normalized_path = video_path.replace('\\', '/')
     
-    if normalized_path in watched:
+    with _PROGRESS_LOCK:
+        watched = get_watched()
+        if normalized_path not in watched:
+            return
         watched.remove(normalized_path)
-        
-        try:
-            with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-                json.dump({'watched': watched}, f, indent=2)
-            print(f"✗ Unmarked: {video_path}")
-        except Exception as e:
-            print(f"Error removing progress: {e}")
+        _write_progress()
+        print(f"✗ Unmarked: {video_path}")
+
+def toggle_progress(video_path):
+    """
+    Flip the watched status of a video. Returns True if it is now watched.
+    """
+    with _PROGRESS_LOCK:
+        if is_watched(video_path):
+            remove_progress(video_path)
+            return False
+        save_progress(video_path)
+        return True
 
 def reset_progress():
     """
     Clear all progress by deleting or emptying progress.json.
     """
-    try:
-        with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-            json.dump({'watched': []}, f, indent=2)
+    with _PROGRESS_LOCK:
+        get_watched().clear()
+        _write_progress()
         print("🔄 Progress reset")
-    except Exception as e:
-        print(f"Error resetting progress: {e}")
 
-def find_subtitle_for_video(video_path, dirpath):
+def subtitles_by_stem(subtitle_files):
     """
-    Find matching subtitle file for a video.
-    Returns relative path to subtitle or None.
+    Map lowercased file stems to subtitle file names for one directory, so
+    each video's subtitle is a single dict lookup with no filesystem calls.
+    `subtitle_files` holds (rank, stem, file name) tuples, where rank is the
+    extension's position in SUBTITLE_EXTENSIONS (lower is preferred).
     """
-    video_name = os.path.splitext(os.path.basename(video_path))[0]
+    # Later entries win, so the preferred extensions are placed last
+    return {stem.lower(): name for _, stem, name in sorted(subtitle_files, reverse=True)}
 
-    for ext in SUBTITLE_EXTENSIONS:
-        subtitle_name = video_name + ext
-        subtitle_path = os.path.join(dirpath, subtitle_name)
-        if os.path.exists(subtitle_path):
-            return subtitle_name
-
-    return None
+# Matches the comma between HH:MM:SS and the milliseconds of an SRT timestamp.
+# The pattern starts with a literal ',' so the engine can jump from comma to
+# comma, and the lookarounds leave commas in the subtitle text untouched.
+_SRT_TIMESTAMP_COMMA = re.compile(r',(?<=\d\d:\d\d:\d\d,)(?=\d\d\d)')
 
 def srt_to_vtt(srt_content):
     """
     Convert SRT subtitle format to WebVTT format.
     """
-    # Add WebVTT header
-    vtt_content = "WEBVTT\n\n"
+    # WebVTT header, then timestamps with a period instead of SRT's comma
+    return "WEBVTT\n\n" + _SRT_TIMESTAMP_COMMA.sub('.', srt_content)
+
+# .srt files up to this size are converted whole and cached; larger ones are
+# converted block by block while being sent, so they never sit in memory
+_SRT_CACHE_MAX_SIZE = 1024 * 1024
+_SRT_STREAM_BLOCK = 64 * 1024
+
+@lru_cache(maxsize=16)
+def _converted_srt(file_path, mtime_ns, size):
+    """
+    Read an SRT file and return it as UTF-8 encoded WebVTT.
+    The modification time and size are part of the cache key, so an edited
+    file is converted again on its next request. Only used for files up to
+    _SRT_CACHE_MAX_SIZE, so the 16 cached entries hold about 16 MB at most.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return srt_to_vtt(f.read()).encode('utf-8')
+
+def _scan_section(section_name, top_dir, dir_mtimes):
+    """
+    Recursively collect the videos of one top-level section folder.
+    Returns the section dict for _walk_course, or None if it has no videos.
+    The mtime of every directory visited is recorded in `dir_mtimes`; a
+    directory that vanishes mid-scan is skipped (if it was recorded, the
+    saved cache simply fails validation next time).
+    Paths are kept as plain '/'-separated strings, which is what ends up
+    in the page anyway.
+    """
+    section_videos = []
+    resources_by_dir = {}
+    
+    # Each directory's mtime is taken before os.walk lists it, so a file added
+    # while the scan runs still makes the saved mtime stale
+    try:
+        dir_mtimes[top_dir] = os.stat(top_dir).st_mtime_ns
+    except OSError:
+        return None  # Removed since the root was listed
+    
+    # Recursively walk through this top-level directory and ALL its subfolders
+    for dirpath, dirnames, filenames in os.walk(top_dir):
+        for name in list(dirnames):
+            subdir = os.path.join(dirpath, name)
+            try:
+                dir_mtimes[subdir] = os.stat(subdir).st_mtime_ns
+            except OSError:
+                dirnames.remove(name)  # Removed mid-scan: nothing to list
+        
+        # Get relative path from top-level section folder (excludes section name),
+        # empty for the section folder itself
+        rel_from_section = dirpath[len(top_dir):].lstrip('\\/').replace('\\', '/')
+        
+        # Get relative path from root (includes section name) - for full path sorting
+        if rel_from_section:
+            rel_from_root = f"{section_name}/{rel_from_section}"
+        else:
+            rel_from_root = section_name
+        
+        # Classify the directory listing in a single pass
+        video_files = []
+        subtitle_files = []
+        resource_names = []
+        for f in filenames:
+            stem, ext = os.path.splitext(f)
+            ext = ext.lower()
+            if ext in _VIDEO_EXTS:
+                video_files.append((stem, f))
+            elif ext in _SUBTITLE_RANK:
+                subtitle_files.append((_SUBTITLE_RANK[ext], stem, f))
+            elif not f.startswith('.') and f != 'index.html':
+                resource_names.append(f)
+        
+        if video_files:
+            subs_by_stem = subtitles_by_stem(subtitle_files)
+            
+            # Resource files in this directory, with paths relative to root
+            resource_files = []
+            for f in resource_names:
+                resource_files.append({
+                    'name': f,
+                    'path': f"{rel_from_root}/{f}"
+                })
+            
+            resource_files.sort(key=lambda x: natural_sort_key(x['name']))
+            
+            # Resources are listed once per directory; videos only refer to it
+            resource_dir = None
+            if resource_files:
+                resource_dir = rel_from_root
+                resources_by_dir[rel_from_root] = resource_files
+            
+            # Build the SMART context (parent folders, excluding section name)
+            # once per directory: it is the same for every video in it
+            context_prefix = None
+            if rel_from_section:
+                # Get path parts
+                subfolder_parts = rel_from_section.split('/')
+                
+                # Smart context extraction: Look for "Module" folders
+                # If we find a folder starting with "Module", only show context from there
+                module_start_idx = None
+                for idx, part in enumerate(subfolder_parts):
+                    if part[:6].lower() == 'module':
+                        module_start_idx = idx
+                        break
+                
+                # Use context from Module onwards, or all if no Module found
+                if module_start_idx is not None:
+                    context_parts = subfolder_parts[module_start_idx:]
+                else:
+                    context_parts = subfolder_parts
+                
+                # Join with " - " separator
+                context_prefix = ' - '.join(context_parts)
+            
+            # Process each video
+            for video_stem, video in video_files:
+                if context_prefix:
+                    video_display_name = f"{context_prefix} - {video_stem}"
+                else:
+                    # Video is directly in the top-level section folder
+                    video_display_name = video_stem
+                
+                # Full path relative to root (for storage and sorting)
+                video_full_path_str = f"{rel_from_root}/{video}"
+                
+                # Find matching subtitle
+                subtitle = subs_by_stem.get(video_stem.lower())
+                subtitle_path = None
+                if subtitle:
+                    subtitle_path = f"{rel_from_root}/{subtitle}"
+                
+                # Paired with its sort key (natural key of the full path)
+                section_videos.append((natural_sort_key(video_full_path_str), {
+                    'name': video_display_name,
+                    'path': video_full_path_str,
+                    'subtitle': subtitle_path,
+                    'resource_dir': resource_dir
+                }))
+    
+    # Only sections with videos are shown
+    if not section_videos:
+        return None
+    
+    # CRUCIAL: Sort videos by FULL FILE PATH (not just display name)
+    # This ensures proper ordering: Module 1 before Module 2, etc.
+    section_videos.sort(key=itemgetter(0))
+    return {
+        'path': section_name,
+        'videos': [video for _, video in section_videos],
+        'resources_by_dir': resources_by_dir
+    }
+
+# Bump whenever the layout of the scan result changes, so old caches are ignored
+_SCAN_CACHE_VERSION = 2
+
+# Files the player itself writes into the course root
+_PLAYER_FILES = frozenset(('index.html', PROGRESS_FILE, SCAN_CACHE_FILE))
+
+def _root_entries(root_dir):
+    """
+    Sorted names in the course root, without the player's own files.
+    The root is compared by listing rather than by mtime, because writing
+    index.html, progress.json or the scan cache there changes its mtime.
+    """
+    with os.scandir(root_dir) as entries:
+        return sorted(entry.name for entry in entries if entry.name not in _PLAYER_FILES)
 
-    # Replace comma with period in timestamps (SRT uses comma, VTT uses period)
-    vtt_content += re.sub(r'(\d{2}:\d{2}:\d{2}),(\d{3})', r'\1.\2', srt_content)
+def _scan_is_current(root_dir, cache):
+    """
+    Check that no directory a saved scan covered has changed since.
+    Adding, removing or renaming a file or folder updates the mtime of the
+    directory containing it, so stat-ing the known directories is enough
+    (plus re-listing the root, see _root_entries).
+    """
+    try:
+        if cache['root'] != _root_entries(root_dir):
+            return False
+        for dirpath, mtime in cache['dirs'].items():
+            if os.stat(os.path.join(root_dir, dirpath)).st_mtime_ns != mtime:
+                return False
+        return True
+    except (OSError, KeyError, TypeError, AttributeError):
+        return False
+
+def _load_scan_cache(root_dir):
+    """
+    Return the scan saved in .scan_cache.json, or None if it is outdated
+    (or there is no usable cache).
+    """
+    try:
+        with open(os.path.join(root_dir, SCAN_CACHE_FILE), 'r', encoding='utf-8') as f:
+            cache = json_loads(f.read())
+        if cache.get('version') != _SCAN_CACHE_VERSION:
+            return None
+        if cache.get('extensions') != [list(VIDEO_EXTENSIONS), list(SUBTITLE_EXTENSIONS)]:
+            return None
+        if not isinstance(cache.get('course'), dict):
+            return None
+    except (OSError, ValueError, AttributeError):
+        return None
+    return cache if _scan_is_current(root_dir, cache) else None
+
+def _save_scan_cache(root_dir, root_names, dir_mtimes, course_structure):
+    """
+    Save the scan result together with the root listing and the section
+    directory mtimes it was based on. Returns the saved cache dict.
+    """
+    cache = {
+        'version': _SCAN_CACHE_VERSION,
+        'extensions': [list(VIDEO_EXTENSIONS), list(SUBTITLE_EXTENSIONS)],
+        'root': root_names,
+        'dirs': {os.path.relpath(dirpath, root_dir): mtime
+                 for dirpath, mtime in dir_mtimes.items()},
+        'course': course_structure,
+    }
+    try:
+        with open(os.path.join(root_dir, SCAN_CACHE_FILE), 'w', encoding='utf-8') as f:
+            f.write(json_dumps(cache))
+    except OSError as e:
+        print(f"Error saving scan cache: {e}")
+    return cache
+
+# Last scan in memory: (root_dir, cache dict, generation). The generation goes
+# up whenever the course structure is rescanned or reloaded from disk, so
+# anything derived from it (like the rendered page) knows when to rebuild.
+_LAST_SCAN = None
+# One scan at a time: page requests arrive on several threads
+_SCAN_LOCK = threading.Lock()
+
+def current_scan(root_dir):
+    """
+    Return (generation, course structure) for root_dir, rescanning only
+    when a directory the last scan covered has changed.
+    """
+    global _LAST_SCAN
+    with _SCAN_LOCK:
+        last = _LAST_SCAN
+        if last is not None and last[0] == root_dir and _scan_is_current(root_dir, last[1]):
+            return last[2], last[1]['course']
 
-    return vtt_content
+        cache = _load_scan_cache(root_dir) or _walk_course(root_dir)
+        generation = last[2] + 1 if last is not None else 1
+        _LAST_SCAN = (root_dir, cache, generation)
+        return generation, cache['course']
 
 def scan_videos(root_dir):
+    """
+    Return the course structure of root_dir (see _walk_course), reusing the
+    previous scan as long as none of the scanned directories has changed.
+    """
+    return current_scan(root_dir)[1]
+
+def _walk_course(root_dir):
     """
     Recursively scan for video files and organize by TOP-LEVEL folders only.
     
@@ -141,230 +493,193 @@ def scan_videos(root_dir):
     - Videos within a section sorted by FULL FILE PATH (not just filename)
       This ensures Module 1 videos appear before Module 2 videos
     
-    Returns a dictionary with sections and their videos.
+    CACHING:
+    - The result is saved to .scan_cache.json, together with what is needed
+      to tell whether it is still current (see _save_scan_cache)
+    
+    Returns the saved cache dict; its 'course' entry holds the sections
+    and their videos.
     """
     course_structure = {}
-    root_path = Path(root_dir)
+    dir_mtimes = {}
     
     # First, collect videos from root directory (not in any folder)
     root_videos = []
     root_resources = []
     
-    for item in root_path.iterdir():
-        if item.is_file():
-            filename = item.name
-            if filename.lower().endswith(VIDEO_EXTENSIONS):
-                # Find matching subtitle
-                subtitle = find_subtitle_for_video(filename, root_dir)
-                
-                root_videos.append({
-                    'name': item.stem,  # Remove extension
-                    'path': filename,
-                    'full_path': filename,  # For sorting
-                    'subtitle': subtitle if subtitle else None,
-                    'resources': []  # Root videos have no resources
-                })
-            elif (not filename.lower().endswith(SUBTITLE_EXTENSIONS) and
-                  not filename.startswith('.') and
-                  filename not in ['index.html', 'progress.json', 'course_player.py']):
-                root_resources.append({
-                    'name': filename,
-                    'path': filename
-                })
+    # Read the root directory once and split it into files and section folders.
+    # DirEntry objects carry the file type from the directory read itself,
+    # so is_file()/is_dir() need no extra stat call (except for symlinks)
+    root_files = []
+    top_level_dirs = []
+    root_names = []
+    with os.scandir(root_dir) as entries:
+        for entry in entries:
+            if entry.name not in _PLAYER_FILES:
+                root_names.append(entry.name)
+            if entry.is_dir():
+                top_level_dirs.append((entry.name, entry.path))
+            elif entry.is_file():
+                root_files.append(entry.name)
+    # Classify root files by extension in a single pass
+    root_video_files = []
+    root_subtitle_files = []
+    for filename in root_files:
+        stem, ext = os.path.splitext(filename)
+        ext = ext.lower()
+        if ext in _VIDEO_EXTS:
+            root_video_files.append((stem, filename))
+        elif ext in _SUBTITLE_RANK:
+            root_subtitle_files.append((_SUBTITLE_RANK[ext], stem, filename))
+        elif (not filename.startswith('.') and
+              filename not in ['index.html', 'progress.json', 'course_player.py']):
+            root_resources.append({
+                'name': filename,
+                'path': filename
+            })
+    
+    root_subtitles = subtitles_by_stem(root_subtitle_files)
+    for stem, filename in root_video_files:
+        # Find matching subtitle
+        subtitle = root_subtitles.get(stem.lower())
+        
+        root_videos.append((natural_sort_key(filename), {
+            'name': stem,  # Remove extension
+            'path': filename,
+            'subtitle': subtitle if subtitle else None,
+            'resource_dir': None  # Root videos have no resources
+        }))
     
     # Add root videos to "General" section if any exist
     if root_videos:
-        root_videos.sort(key=lambda x: natural_sort_key(x['full_path']))
+        root_videos.sort(key=itemgetter(0))
         root_resources.sort(key=lambda x: natural_sort_key(x['name']))
-        # Remove full_path before storing
-        for vid in root_videos:
-            vid.pop('full_path', None)
         course_structure['00-General'] = {
             'path': '.',
-            'videos': root_videos
+            'videos': [video for _, video in root_videos],
+            'resources_by_dir': {}
         }
     
-    # Get only TOP-LEVEL directories (immediate subdirectories of root)
-    top_level_dirs = [d for d in root_path.iterdir() if d.is_dir()]
-    top_level_dirs.sort(key=lambda x: natural_sort_key(x.name))
+    # Scan the top-level sections (collected above) in parallel: the walks are
+    # independent and I/O bound, and the GIL is released during directory reads.
+    # No need to sort them here: section order is decided once at the end.
+    if top_level_dirs:
+        with ThreadPoolExecutor(max_workers=min(8, len(top_level_dirs))) as executor:
+            sections = executor.map(lambda d: _scan_section(*d, dir_mtimes), top_level_dirs)
+            for (section_name, _), section in zip(top_level_dirs, sections):
+                if section:
+                    course_structure[section_name] = section
     
-    # Process each top-level section
-    for top_dir in top_level_dirs:
-        section_name = top_dir.name
-        section_videos = []
-        
-        # Recursively walk through this top-level directory and ALL its subfolders
-        for dirpath, dirnames, filenames in os.walk(str(top_dir)):
-            current_dir = Path(dirpath)
-            
-            # Get relative path from top-level section folder (excludes section name)
-            rel_from_section = current_dir.relative_to(top_dir)
-            
-            # Get relative path from root (includes section name) - for full path sorting
-            rel_from_root = current_dir.relative_to(root_path)
-            
-            # Find video files in current directory
-            video_files = [f for f in filenames if f.lower().endswith(VIDEO_EXTENSIONS)]
-            
-            if video_files:
-                # Find resource files in this directory
-                resource_files = []
-                for f in filenames:
-                    f_lower = f.lower()
-                    if (not f_lower.endswith(VIDEO_EXTENSIONS) and
-                        not f_lower.endswith(SUBTITLE_EXTENSIONS) and
-                        not f.startswith('.') and
-                        f != 'index.html'):
-                        # Path relative to root
-                        resource_rel_path = current_dir.relative_to(root_path) / f
-                        resource_files.append({
-                            'name': f,
-                            'path': str(resource_rel_path).replace('\\', '/')
-                        })
-                
-                resource_files.sort(key=lambda x: natural_sort_key(x['name']))
-                
-                # Process each video
-                for video in video_files:
-                    video_stem = Path(video).stem
-                    
-                    # Build display name with SMART context (parent folders, excluding section name)
-                    if str(rel_from_section) != '.':
-                        # Get path parts
-                        subfolder_parts = str(rel_from_section).replace('\\', '/').split('/')
-                        
-                        # Smart context extraction: Look for "Module" folders
-                        # If we find a folder starting with "Module", only show context from there
-                        module_start_idx = None
-                        for idx, part in enumerate(subfolder_parts):
-                            if part.lower().startswith('module'):
-                                module_start_idx = idx
-                                break
-                        
-                        # Use context from Module onwards, or all if no Module found
-                        if module_start_idx is not None:
-                            context_parts = subfolder_parts[module_start_idx:]
-                        else:
-                            context_parts = subfolder_parts
-                        
-                        # Join with " - " separator
-                        context_prefix = ' - '.join(context_parts)
-                        video_display_name = f"{context_prefix} - {video_stem}"
-                    else:
-                        # Video is directly in the top-level section folder
-                        video_display_name = video_stem
-                    
-                    # Full path relative to root (for storage and sorting)
-                    video_rel_path = rel_from_root / video
-                    video_full_path_str = str(video_rel_path).replace('\\', '/')
-                    
-                    # Find matching subtitle
-                    subtitle = find_subtitle_for_video(video, str(current_dir))
-                    subtitle_path = None
-                    if subtitle:
-                        subtitle_rel_path = current_dir.relative_to(root_path) / subtitle
-                        subtitle_path = str(subtitle_rel_path).replace('\\', '/')
-                    
-                    section_videos.append({
-                        'name': video_display_name,
-                        'path': video_full_path_str,
-                        'full_path': video_full_path_str,  # For sorting by full path
-                        'subtitle': subtitle_path,
-                        'resources': resource_files
-                    })
-        
-        # CRUCIAL: Sort videos by FULL FILE PATH (not just display name)
-        # This ensures proper ordering: Module 1 before Module 2, etc.
-        section_videos.sort(key=lambda x: natural_sort_key(x['full_path']))
-        
-        # Remove the temporary full_path field before storing
-        for vid in section_videos:
-            vid.pop('full_path', None)
-        
-        # Add section to course structure if it has videos
-        if section_videos:
-            course_structure[section_name] = {
-                'path': str(top_dir.relative_to(root_path)).replace('\\', '/'),
-                'videos': section_videos
-            }
+    # Sort sections naturally by section name, computing each key only once
+    keyed_sections = [(natural_sort_key(name), name, data)
+                      for name, data in course_structure.items()]
+    keyed_sections.sort(key=itemgetter(0))
+    course_structure = {name: data for _, name, data in keyed_sections}
     
-    # Sort sections naturally by section name
-    sorted_sections = sorted(course_structure.items(), key=lambda x: natural_sort_key(x[0]))
-    return dict(sorted_sections)
+    root_names.sort()
+    return _save_scan_cache(root_dir, root_names, dir_mtimes, course_structure)
 
-def generate_html(course_data, course_name):
+# Placeholders in the page template look like __COURSE_NAME__
+_TEMPLATE_FIELD = re.compile(r'__([A-Z_]+)__')
+
+def _render_template(parts, fields):
     """
-    Generate a complete HTML page with embedded CSS and JavaScript.
+    Fill a template that was pre-split with _TEMPLATE_FIELD.split().
+    Odd-indexed parts are field names, the rest is literal text.
     """
-    # Convert course data to JSON for embedding
-    course_json = json.dumps(course_data, indent=2)
-    
-    # Load watched videos for injection
-    watched_videos = load_progress()
-    watched_json = json.dumps(watched_videos)
+    return ''.join(fields[part] if i % 2 else part for i, part in enumerate(parts))
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{course_name} - Course Player</title>
-    <style>
-        * {{
+# CSS minification: comments, runs of whitespace, spaces around punctuation
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE = re.compile(r'\s+')
+_CSS_PUNCT_SPACE = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON_SPACE = re.compile(r':\s+')
+
+def minify_css(css):
+    """
+    Strip comments and insignificant whitespace from a stylesheet.
+    Only handles what our own stylesheet uses (no spaces inside strings).
+    """
+    css = _CSS_COMMENT.sub('', css)
+    css = _CSS_SPACE.sub(' ', css)
+    css = _CSS_PUNCT_SPACE.sub(r'\1', css)
+    css = _CSS_COLON_SPACE.sub(':', css)
+    return css.replace(';}', '}').strip()
+
+# Stylesheet for the player page (plain string, no brace escaping needed)
+_PAGE_CSS = r"""
+        /* Color palette, also used by the deferred stylesheet */
+        :root {
+            --bg: #1e1e1e;
+            --panel: #252526;
+            --header: #2d2d30;
+            --border: #3c3c3c;
+            --muted: #888;
+            --accent: #007acc;
+            --success: #4caf50;
+            --thumb: #555;
+            --thumb-hover: #666;
+            --caption: #4fc3f7;
+            --progress: #ff0000;
+        }
+
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #1e1e1e;
+            background: var(--bg);
             color: #e0e0e0;
             overflow: hidden;
-        }}
+        }
 
-        .container {{
+        .container {
             display: flex;
             height: 100vh;
-        }}
+        }
 
         /* Sidebar Styles */
-        .sidebar {{
+        .sidebar {
             min-width: 200px;
             max-width: 600px;
             width: 280px;
-            background: #252526;
+            background: var(--panel);
             overflow-y: auto;
             display: flex;
             flex-direction: column;
             flex-shrink: 0;
-        }}
+            /* Keep sidebar updates from invalidating the rest of the page */
+            contain: layout paint style;
+        }
 
-        .sidebar-header {{
+        .sidebar-header {
             padding: 20px;
-            background: #2d2d30;
-            border-bottom: 1px solid #3c3c3c;
+            background: var(--header);
+            border-bottom: 1px solid var(--border);
             position: sticky;
             top: 0;
             z-index: 10;
-        }}
+        }
 
-        .sidebar-header h1 {{
+        .sidebar-header h1 {
             font-size: 18px;
             color: #fff;
             margin-bottom: 12px;
-        }}
+        }
 
-        .header-controls {{
+        .header-controls {
             display: flex;
             align-items: center;
             justify-content: space-between;
             gap: 10px;
-        }}
+        }
 
-        .progress-badge {{
+        .progress-badge {
             flex: 1;
-            background: #007acc;
+            background: var(--accent);
             color: white;
             padding: 6px 12px;
             border-radius: 20px;
@@ -375,9 +690,9 @@ def generate_html(course_data, course_name):
             align-items: center;
             justify-content: center;
             gap: 5px;
-        }}
+        }
 
-        .reset-progress-btn {{
+        .reset-progress-btn {
             background: #d32f2f;
             color: white;
             border: none;
@@ -391,24 +706,24 @@ def generate_html(course_data, course_name):
             justify-content: center;
             gap: 4px;
             white-space: nowrap;
-        }}
+        }
 
-        .reset-progress-btn:hover {{
+        .reset-progress-btn:hover {
             background: #b71c1c;
-        }}
+        }
 
-        .sections {{
+        .sections {
             flex: 1;
             padding: 10px;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 10px;
-        }}
+        }
 
-        .section-header {{
+        .section-header {
             padding: 12px 15px;
-            background: #2d2d30;
+            background: var(--header);
             border-radius: 5px;
             cursor: pointer;
             display: flex;
@@ -416,79 +731,86 @@ def generate_html(course_data, course_name):
             align-items: center;
             transition: background 0.2s;
             user-select: none;
-        }}
+        }
 
-        .section-header:hover {{
+        .section-header:hover {
             background: #37373d;
-        }}
+        }
 
-        .section-header.active {{
+        .section-header.active {
             background: #094771;
-        }}
+        }
 
-        .section-header.completed {{
+        .section-header.completed {
             background: #2e7d32;
             color: white;
-        }}
+        }
 
-        .section-header.completed:hover {{
+        .section-header.completed:hover {
             background: #388e3c;
-        }}
+        }
 
-        .section-header.completed .section-title {{
+        .section-header.completed .section-title {
             color: white;
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 14px;
             font-weight: 600;
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .section-progress {{
+        .section-progress {
             font-size: 12px;
             font-weight: 500;
             padding: 2px 8px;
             border-radius: 10px;
             background: rgba(255, 255, 255, 0.1);
-        }}
+        }
 
-        .section-progress.in-progress {{
-            color: #888;
-        }}
+        .section-progress.in-progress {
+            color: var(--muted);
+        }
 
-        .section-progress.completed {{
-            color: #4caf50;
+        .section-progress.completed {
+            color: var(--success);
             background: rgba(76, 175, 80, 0.2);
-        }}
+        }
 
-        .section-progress .checkmark {{
+        .section-progress .checkmark {
             font-size: 14px;
             margin-right: 2px;
-        }}
+        }
 
-        .section-arrow {{
+        .section-progress.in-progress .checkmark {
+            display: none;
+        }
+
+        .section-arrow {
             transition: transform 0.3s;
-            color: #888;
-        }}
+            color: var(--muted);
+        }
 
-        .section.expanded .section-arrow {{
+        .section.expanded .section-arrow {
             transform: rotate(90deg);
-        }}
+        }
 
-        .video-list {{
+        .video-list {
             max-height: 0;
             overflow: hidden;
             transition: max-height 0.3s ease;
-        }}
+            /* Skip rendering lists that are scrolled out of view */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 300px;
+        }
 
-        .section.expanded .video-list {{
+        .section.expanded .video-list {
             max-height: 2000px;
-        }}
+        }
 
-        .video-item {{
+        .video-item {
             padding: 10px 15px 10px 30px;
             cursor: pointer;
             font-size: 13px;
@@ -498,33 +820,33 @@ def generate_html(course_data, course_name):
             align-items: center;
             justify-content: space-between;
             gap: 8px;
-        }}
+        }
 
-        .video-item:hover {{
-            background: #2d2d30;
+        .video-item:hover {
+            background: var(--header);
             padding-left: 35px;
-        }}
+        }
 
-        .video-item.active {{
+        .video-item.active {
             background: #1e3a52;
-            border-left: 3px solid #007acc;
-            color: #4fc3f7;
+            border-left: 3px solid var(--accent);
+            color: var(--caption);
             font-weight: 500;
-        }}
+        }
 
-        .video-item.watched {{
+        .video-item.watched {
             opacity: 0.8;
-        }}
+        }
 
-        .video-item.watched .video-name {{
+        .video-item.watched .video-name {
             text-decoration: line-through;
-        }}
+        }
 
-        .video-checkmark {{
+        .video-checkmark {
             width: 18px;
             height: 18px;
             border-radius: 50%;
-            border: 2px solid #555;
+            border: 2px solid var(--thumb);
             display: flex;
             align-items: center;
             justify-content: center;
@@ -532,73 +854,73 @@ def generate_html(course_data, course_name):
             flex-shrink: 0;
             transition: all 0.2s;
             cursor: pointer;
-        }}
+        }
 
-        .video-item.watched .video-checkmark {{
-            background: #4caf50;
-            border-color: #4caf50;
+        .video-item.watched .video-checkmark {
+            background: var(--success);
+            border-color: var(--success);
             color: white;
-        }}
+        }
 
-        .video-checkmark:hover {{
-            border-color: #4caf50;
+        .video-checkmark:hover {
+            border-color: var(--success);
             transform: scale(1.1);
-        }}
+        }
 
-        .video-name {{
+        .video-name {
             flex: 1;
-        }}
+        }
 
         /* Resizer Styles */
-        .resizer {{
+        .resizer {
             width: 5px;
-            background: #3c3c3c;
+            background: var(--border);
             cursor: col-resize;
             flex-shrink: 0;
             transition: background 0.2s;
             position: relative;
-        }}
+        }
 
-        .resizer:hover {{
-            background: #007acc;
-        }}
+        .resizer:hover {
+            background: var(--accent);
+        }
 
-        .resizer::before {{
+        .resizer::before {
             content: '';
             position: absolute;
             top: 0;
             left: -2px;
             right: -2px;
             bottom: 0;
-        }}
+        }
 
-        body.resizing {{
+        body.resizing {
             cursor: col-resize;
             user-select: none;
-        }}
+        }
 
-        body.resizing * {{
+        body.resizing * {
             cursor: col-resize !important;
             user-select: none !important;
-        }}
+        }
 
         /* Main Content Styles */
-        .main-content {{
+        .main-content {
             flex: 1;
             display: flex;
             flex-direction: column;
-            background: #1e1e1e;
+            background: var(--bg);
             overflow-y: auto;
             overflow-x: hidden;
-        }}
+        }
 
-        .video-wrapper {{
+        .video-wrapper {
             width: 100%;
             background: #000;
             flex-shrink: 0;
-        }}
+        }
 
-        .video-container {{
+        .video-container {
             width: 100%;
             aspect-ratio: 16 / 9;
             max-height: 86vh;
@@ -608,36 +930,36 @@ def generate_html(course_data, course_name):
             justify-content: center;
             background: #000;
             cursor: pointer;
-        }}
+        }
 
-        .video-container.fullscreen {{
+        .video-container.fullscreen {
             position: fixed;
             top: 0;
             left: 0;
             width: 100vw;
             height: 100vh;
             z-index: 9999;
-        }}
+        }
 
-        .video-container.fullscreen.hide-cursor {{
+        .video-container.fullscreen.hide-cursor {
             cursor: none;
-        }}
+        }
 
-        video {{
+        video {
             width: 100%;
             height: auto;
             max-height: 100%;
             outline: none;
             display: block;
-        }}
+        }
 
-        .video-container.fullscreen video {{
+        .video-container.fullscreen video {
             width: 100%;
             height: 100%;
-        }}
+        }
 
         /* Welcome Screen */
-        .welcome-screen {{
+        .welcome-screen {
             position: absolute;
             top: 50%;
             left: 50%;
@@ -646,28 +968,28 @@ def generate_html(course_data, course_name):
             flex-direction: column;
             align-items: center;
             justify-content: center;
-            color: #888;
+            color: var(--muted);
             pointer-events: none;
-        }}
+        }
 
-        .welcome-screen svg {{
+        .welcome-screen svg {
             width: 100px;
             height: 100px;
             margin-bottom: 20px;
             opacity: 0.5;
-        }}
+        }
 
-        .welcome-screen h2 {{
+        .welcome-screen h2 {
             font-size: 24px;
             margin-bottom: 10px;
-        }}
+        }
 
-        .welcome-screen p {{
+        .welcome-screen p {
             font-size: 16px;
-        }}
+        }
 
         /* Custom Video Controls Overlay */
-        .video-controls {{
+        .video-controls {
             position: absolute;
             bottom: 0;
             left: 0;
@@ -677,28 +999,30 @@ def generate_html(course_data, course_name):
             opacity: 0;
             transition: opacity 0.3s;
             pointer-events: none;
-        }}
+            /* No paint containment: the CC/settings menus extend above the bar */
+            contain: layout style;
+        }
 
         .video-container:hover .video-controls,
         .video-controls:hover,
-        .video-controls.always-show {{
+        .video-controls.always-show {
             opacity: 1;
             pointer-events: all;
-        }}
+        }
 
         /* In fullscreen, only show controls when explicitly set */
-        .video-container.fullscreen .video-controls {{
+        .video-container.fullscreen .video-controls {
             opacity: 0;
             pointer-events: none;
-        }}
+        }
 
-        .video-container.fullscreen .video-controls.always-show {{
+        .video-container.fullscreen .video-controls.always-show {
             opacity: 1;
             pointer-events: all;
-        }}
+        }
 
         /* Progress Bar */
-        .progress-bar-container {{
+        .progress-bar-container {
             width: 100%;
             height: 5px;
             background: rgba(255, 255, 255, 0.3);
@@ -706,39 +1030,58 @@ def generate_html(course_data, course_name):
             position: relative;
             margin-bottom: 10px;
             border-radius: 2px;
-        }}
+        }
 
-        .progress-bar-container:hover {{
+        .progress-bar-container:hover {
             height: 7px;
-        }}
+        }
 
-        .progress-bar {{
+        /*
+         * The bar always spans the full width and is scaled with
+         * transform: scaleX(fraction), which only needs compositing. The knob
+         * lives on a separate full-width layer moved with translateX(percent),
+         * so it is not squashed by the scaling. Set both through setProgress().
+         */
+        .progress-bar {
             height: 100%;
-            background: #ff0000;
-            width: 0%;
-            position: relative;
+            background: var(--progress);
+            width: 100%;
             border-radius: 2px;
-        }}
+            transform-origin: left center;
+            transform: scaleX(0);
+            will-change: transform;
+        }
+
+        .progress-knob {
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            transform: translateX(0%);
+            will-change: transform;
+            pointer-events: none;
+        }
 
-        .progress-bar::after {{
+        .progress-knob::after {
             content: '';
             position: absolute;
-            right: 0;
+            left: -6px;
             top: 50%;
             transform: translateY(-50%);
             width: 12px;
             height: 12px;
-            background: #ff0000;
+            background: var(--progress);
             border-radius: 50%;
             opacity: 0;
             transition: opacity 0.2s;
-        }}
+        }
 
-        .progress-bar-container:hover .progress-bar::after {{
+        .progress-bar-container:hover .progress-knob::after {
             opacity: 1;
-        }}
+        }
 
-        .progress-tooltip {{
+        .progress-tooltip {
             position: absolute;
             bottom: 10px;
             background: rgba(0, 0, 0, 0.9);
@@ -749,20 +1092,20 @@ def generate_html(course_data, course_name):
             pointer-events: none;
             opacity: 0;
             transition: opacity 0.2s;
-        }}
+        }
 
-        .progress-bar-container:hover .progress-tooltip {{
+        .progress-bar-container:hover .progress-tooltip {
             opacity: 1;
-        }}
+        }
 
         /* Control Buttons Row */
-        .controls-row {{
+        .controls-row {
             display: flex;
             align-items: center;
             gap: 12px;
-        }}
+        }
 
-        .control-button {{
+        .control-button {
             background: none;
             border: none;
             color: white;
@@ -773,37 +1116,37 @@ def generate_html(course_data, course_name):
             justify-content: center;
             transition: transform 0.2s, opacity 0.2s;
             opacity: 0.9;
-        }}
+        }
 
-        .control-button:hover {{
+        .control-button:hover {
             transform: scale(1.1);
             opacity: 1;
-        }}
+        }
 
-        .control-button:disabled {{
+        .control-button:disabled {
             opacity: 0.3;
             cursor: not-allowed;
-        }}
+        }
 
-        .control-button svg {{
+        .control-button svg {
             width: 24px;
             height: 24px;
             fill: currentColor;
-        }}
+        }
 
-        .control-button.play-pause svg {{
+        .control-button.play-pause svg {
             width: 32px;
             height: 32px;
-        }}
+        }
 
         /* Volume Control */
-        .volume-control {{
+        .volume-control {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .volume-slider {{
+        .volume-slider {
             width: 0;
             opacity: 0;
             transition: width 0.3s, opacity 0.3s;
@@ -812,50 +1155,117 @@ def generate_html(course_data, course_name):
             background: rgba(255, 255, 255, 0.3);
             outline: none;
             border-radius: 2px;
-        }}
+        }
 
-        .volume-control:hover .volume-slider {{
+        .volume-control:hover .volume-slider {
             width: 60px;
             opacity: 1;
-        }}
+        }
 
-        .volume-slider::-webkit-slider-thumb {{
+        .volume-slider::-webkit-slider-thumb {
             -webkit-appearance: none;
             width: 12px;
             height: 12px;
             background: #fff;
             cursor: pointer;
             border-radius: 50%;
-        }}
+        }
 
-        .volume-slider::-moz-range-thumb {{
+        .volume-slider::-moz-range-thumb {
             width: 12px;
             height: 12px;
             background: #fff;
             cursor: pointer;
             border-radius: 50%;
             border: none;
-        }}
+        }
 
         /* Time Display */
-        .time-display {{
+        .time-display {
             color: white;
             font-size: 14px;
             font-weight: 500;
             min-width: 100px;
-        }}
+        }
 
         /* Spacer */
-        .spacer {{
+        .spacer {
             flex: 1;
-        }}
+        }
+
+        /* Video Info Bar */
+        .video-info {
+            padding: 20px 30px;
+            background: var(--panel);
+            border-top: 1px solid var(--border);
+        }
+
+        .video-title {
+            font-size: 20px;
+            font-weight: 600;
+            margin-bottom: 8px;
+            color: #fff;
+        }
+
+        .video-section {
+            font-size: 14px;
+            color: var(--muted);
+        }
+
+        /* Keyboard Shortcuts Help */
+        .shortcuts-info {
+            padding: 15px 30px;
+            background: var(--header);
+            border-top: 1px solid var(--border);
+            font-size: 12px;
+            color: var(--muted);
+        }
+
+        .shortcuts-info strong {
+            color: var(--accent);
+        }
+
+        /* Scrollbar Styles */
+        .sidebar::-webkit-scrollbar,
+        .main-content::-webkit-scrollbar,
+        .resources-panel::-webkit-scrollbar {
+            width: 8px;
+        }
+
+        .sidebar::-webkit-scrollbar-track,
+        .main-content::-webkit-scrollbar-track,
+        .resources-panel::-webkit-scrollbar-track {
+            background: var(--bg);
+        }
+
+        .resources-panel::-webkit-scrollbar-track {
+            border-radius: 4px;
+        }
 
+        .sidebar::-webkit-scrollbar-thumb,
+        .main-content::-webkit-scrollbar-thumb,
+        .resources-panel::-webkit-scrollbar-thumb {
+            background: var(--thumb);
+            border-radius: 4px;
+        }
+
+        .sidebar::-webkit-scrollbar-thumb:hover,
+        .main-content::-webkit-scrollbar-thumb:hover,
+        .resources-panel::-webkit-scrollbar-thumb:hover {
+            background: var(--thumb-hover);
+        }
+"""
+
+# Styles for things that only show up after interaction (menus, toast, resources,
+# spinner). They are served as /static/deferred.css and loaded without blocking
+# the first paint; everything visible on the welcome screen stays in _PAGE_CSS.
+_DEFERRED_CSS = r"""
         /* Settings Menu (Speed) */
-        .settings-menu {{
+        .settings-menu {
             position: relative;
-        }}
+        }
 
-        .settings-dropdown {{
+        .settings-dropdown {
             position: absolute;
             bottom: 100%;
             right: 0;
@@ -866,18 +1276,18 @@ def generate_html(course_data, course_name):
             min-width: 120px;
             display: none;
             box-shadow: 0 4px 12px rgba(0, 0, 0, 0.5);
-        }}
+        }
 
-        .settings-dropdown.show {{
+        .settings-dropdown.show {
             display: block;
-        }}
+        }
 
         /* CC Menu */
-        .cc-menu {{
+        .cc-menu {
             position: relative;
-        }}
+        }
 
-        .cc-dropdown {{
+        .cc-dropdown {
             position: absolute;
             bottom: 100%;
             right: 0;
@@ -888,13 +1298,13 @@ def generate_html(course_data, course_name):
             min-width: 160px;
             display: none;
             box-shadow: 0 4px 12px rgba(0, 0, 0, 0.5);
-        }}
+        }
 
-        .cc-dropdown.show {{
+        .cc-dropdown.show {
             display: block;
-        }}
+        }
 
-        .settings-item {{
+        .settings-item {
             padding: 8px 16px;
             cursor: pointer;
             font-size: 14px;
@@ -902,22 +1312,22 @@ def generate_html(course_data, course_name):
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
+        }
 
-        .settings-item:hover {{
+        .settings-item:hover {
             background: rgba(255, 255, 255, 0.1);
-        }}
+        }
 
-        .settings-item.active {{
-            color: #4fc3f7;
-        }}
+        .settings-item.active {
+            color: var(--caption);
+        }
 
-        .settings-item.active::after {{
+        .settings-item.active::after {
             content: '✓';
             margin-left: 10px;
-        }}
+        }
 
-        .cc-item {{
+        .cc-item {
             padding: 8px 16px;
             cursor: pointer;
             font-size: 14px;
@@ -925,18 +1335,18 @@ def generate_html(course_data, course_name):
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .cc-item:hover {{
+        .cc-item:hover {
             background: rgba(255, 255, 255, 0.1);
-        }}
+        }
 
-        .cc-item.active {{
-            color: #4fc3f7;
-        }}
+        .cc-item.active {
+            color: var(--caption);
+        }
 
         /* Speed Toast */
-        .speed-toast {{
+        .speed-toast {
             position: absolute;
             top: 50%;
             left: 50%;
@@ -951,35 +1361,17 @@ def generate_html(course_data, course_name):
             pointer-events: none;
             transition: opacity 0.3s;
             z-index: 1000;
-        }}
+        }
 
-        .speed-toast.show {{
+        .speed-toast.show {
             opacity: 1;
-        }}
-
-        /* Video Info Bar */
-        .video-info {{
-            padding: 20px 30px;
-            background: #252526;
-            border-top: 1px solid #3c3c3c;
-        }}
-
-        .video-title {{
-            font-size: 20px;
-            font-weight: 600;
-            margin-bottom: 8px;
-            color: #fff;
-        }}
-
-        .video-section {{
-            font-size: 14px;
-            color: #888;
-        }}
+            will-change: opacity;
+        }
 
         /* Course Resources */
-        .resources-button {{
+        .resources-button {
             margin-top: 15px;
-            background: #007acc;
+            background: var(--accent);
             color: white;
             border: none;
             padding: 10px 16px;
@@ -990,177 +1382,143 @@ def generate_html(course_data, course_name):
             display: inline-flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .resources-button:hover {{
+        .resources-button:hover {
             background: #005a9e;
-        }}
+        }
 
-        .resources-button:disabled {{
-            background: #555;
+        .resources-button:disabled {
+            background: var(--thumb);
             cursor: not-allowed;
             opacity: 0.5;
-        }}
+        }
 
-        .resources-panel {{
+        .resources-panel {
             margin-top: 15px;
             padding: 15px;
-            background: #2d2d30;
+            background: var(--header);
             border-radius: 6px;
-            border: 1px solid #3c3c3c;
+            border: 1px solid var(--border);
             max-height: 300px;
             overflow-y: auto;
             display: none;
-        }}
+        }
 
-        .resources-panel.show {{
+        .resources-panel.show {
             display: block;
-        }}
+        }
 
-        .resources-panel h3 {{
+        .resources-panel h3 {
             font-size: 16px;
             color: #fff;
             margin-bottom: 12px;
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .resource-item {{
+        .resource-item {
             padding: 10px 12px;
             margin-bottom: 8px;
-            background: #1e1e1e;
+            background: var(--bg);
             border-radius: 4px;
-            border-left: 3px solid #007acc;
+            border-left: 3px solid var(--accent);
             transition: background 0.2s, transform 0.2s;
-        }}
+        }
 
-        .resource-item:hover {{
-            background: #252526;
+        .resource-item:hover {
+            background: var(--panel);
             transform: translateX(5px);
-        }}
+        }
 
-        .resource-item a {{
-            color: #4fc3f7;
+        .resource-item a {
+            color: var(--caption);
             text-decoration: none;
             font-size: 14px;
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .resource-item a:hover {{
+        .resource-item a:hover {
             color: #81d4fa;
             text-decoration: underline;
-        }}
+        }
 
-        .resource-icon {{
+        .resource-icon {
             font-size: 16px;
-        }}
+        }
 
-        .resources-empty {{
-            color: #888;
+        .resources-empty {
+            color: var(--muted);
             font-style: italic;
             text-align: center;
             padding: 20px;
-        }}
-
-        .resources-panel::-webkit-scrollbar {{
-            width: 8px;
-        }}
-
-        .resources-panel::-webkit-scrollbar-track {{
-            background: #1e1e1e;
-            border-radius: 4px;
-        }}
-
-        .resources-panel::-webkit-scrollbar-thumb {{
-            background: #555;
-            border-radius: 4px;
-        }}
-
-        .resources-panel::-webkit-scrollbar-thumb:hover {{
-            background: #666;
-        }}
-
-        /* Keyboard Shortcuts Help */
-        .shortcuts-info {{
-            padding: 15px 30px;
-            background: #2d2d30;
-            border-top: 1px solid #3c3c3c;
-            font-size: 12px;
-            color: #888;
-        }}
-
-        .shortcuts-info strong {{
-            color: #007acc;
-        }}
-
-        /* Scrollbar Styles */
-        .sidebar::-webkit-scrollbar {{
-            width: 8px;
-        }}
-
-        .sidebar::-webkit-scrollbar-track {{
-            background: #1e1e1e;
-        }}
-
-        .sidebar::-webkit-scrollbar-thumb {{
-            background: #555;
-            border-radius: 4px;
-        }}
-
-        .sidebar::-webkit-scrollbar-thumb:hover {{
-            background: #666;
-        }}
-
-        .main-content::-webkit-scrollbar {{
-            width: 8px;
-        }}
-
-        .main-content::-webkit-scrollbar-track {{
-            background: #1e1e1e;
-        }}
-
-        .main-content::-webkit-scrollbar-thumb {{
-            background: #555;
-            border-radius: 4px;
-        }}
-
-        .main-content::-webkit-scrollbar-thumb:hover {{
-            background: #666;
-        }}
+        }
 
         /* Loading Spinner */
-        .loading-spinner {{
+        .loading-spinner {
             position: absolute;
             top: 50%;
             left: 50%;
-            transform: translate(-50%, -50%);
+            /* Centered with margins so the animation only has to rotate */
+            margin: -25px 0 0 -25px;
             width: 50px;
             height: 50px;
             border: 4px solid rgba(255, 255, 255, 0.2);
-            border-top-color: #007acc;
+            border-top-color: var(--accent);
             border-radius: 50%;
             animation: spin 1s linear infinite;
             display: none;
-        }}
+        }
 
-        @keyframes spin {{
-            to {{ transform: translate(-50%, -50%) rotate(360deg); }}
-        }}
+        @keyframes spin {
+            from { transform: rotate(0deg); }
+            to { transform: rotate(360deg); }
+        }
 
-        .loading-spinner.show {{
+        .loading-spinner.show {
             display: block;
-        }}
-    </style>
+            will-change: transform;
+        }
+"""
+
+# Minified once at import time, served with every page
+_PAGE_STYLE = minify_css(_PAGE_CSS) if MINIFY_CSS else _PAGE_CSS
+_DEFERRED_STYLE = (minify_css(_DEFERRED_CSS) if MINIFY_CSS else _DEFERRED_CSS).encode('utf-8')
+
+# Player page markup and script, split once at import time around its fields
+_PAGE_TEMPLATE = _TEMPLATE_FIELD.split(r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>__COURSE_NAME__ - Course Player</title>
+    <style>__PAGE_CSS__</style>
+    <link rel="preload" href="/static/deferred.css" as="style" onload="this.onload=null; this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="/static/deferred.css"></noscript>
 </head>
 <body>
+    <!-- Icon sprite: each icon is drawn with <svg><use href="#i-name"/></svg> -->
+    <svg width="0" height="0" style="position: absolute;" aria-hidden="true">
+        <symbol id="i-play" viewBox="0 0 24 24"><path d="M8 5v14l11-7z"/></symbol>
+        <symbol id="i-pause" viewBox="0 0 24 24"><path d="M6 4h4v16H6V4zm8 0h4v16h-4V4z"/></symbol>
+        <symbol id="i-prev" viewBox="0 0 24 24"><path d="M6 6h2v12H6zm3.5 6l8.5 6V6z"/></symbol>
+        <symbol id="i-next" viewBox="0 0 24 24"><path d="M16 18h2V6h-2v12zM6 18l8.5-6L6 6v12z"/></symbol>
+        <symbol id="i-volume" viewBox="0 0 24 24"><path d="M3 9v6h4l5 5V4L7 9H3zm13.5 3c0-1.77-1.02-3.29-2.5-4.03v8.05c1.48-.73 2.5-2.25 2.5-4.02z"/></symbol>
+        <symbol id="i-mute" viewBox="0 0 24 24"><path d="M16.5 12c0-1.77-1.02-3.29-2.5-4.03v2.21l2.45 2.45c.03-.2.05-.41.05-.63zm2.5 0c0 .94-.2 1.82-.54 2.64l1.51 1.51C20.63 14.91 21 13.5 21 12c0-4.28-2.99-7.86-7-8.77v2.06c2.89.86 5 3.54 5 6.71zM4.27 3L3 4.27 7.73 9H3v6h4l5 5v-6.73l4.25 4.25c-.67.52-1.42.93-2.25 1.18v2.06c1.38-.31 2.63-.95 3.69-1.81L19.73 21 21 19.73l-9-9L4.27 3zM12 4L9.91 6.09 12 8.18V4z"/></symbol>
+        <symbol id="i-cc" viewBox="0 0 24 24"><path d="M19 4H5c-1.11 0-2 .9-2 2v12c0 1.1.89 2 2 2h14c1.1 0 2-.9 2-2V6c0-1.1-.9-2-2-2zm-8 7H9.5v-.5h-2v3h2V13H11v1c0 .55-.45 1-1 1H7c-.55 0-1-.45-1-1v-4c0-.55.45-1 1-1h3c.55 0 1 .45 1 1v1zm7 0h-1.5v-.5h-2v3h2V13H18v1c0 .55-.45 1-1 1h-3c-.55 0-1-.45-1-1v-4c0-.55.45-1 1-1h3c.55 0 1 .45 1 1v1z"/></symbol>
+        <symbol id="i-settings" viewBox="0 0 24 24"><path d="M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58c.18-.14.23-.41.12-.61l-1.92-3.32c-.12-.22-.37-.29-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54c-.04-.24-.24-.41-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58c-.18.14-.23.41-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.56 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61l-2.01-1.58zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6z"/></symbol>
+        <symbol id="i-fullscreen" viewBox="0 0 24 24"><path d="M7 14H5v5h5v-2H7v-3zm-2-4h2V7h3V5H5v5zm12 7h-3v2h5v-5h-2v3zM14 5v2h3v3h2V5h-5z"/></symbol>
+        <symbol id="i-fullscreen-exit" viewBox="0 0 24 24"><path d="M5 16h3v3h2v-5H5v2zm3-8H5v2h5V5H8v3zm6 11h2v-3h3v-2h-5v5zm2-11V5h-2v5h5V8h-3z"/></symbol>
+    </svg>
+
     <div class="container">
         <!-- Sidebar -->
         <div class="sidebar" id="sidebar">
             <div class="sidebar-header">
-                <h1>📚 {course_name}</h1>
+                <h1>📚 __COURSE_NAME__</h1>
                 <div class="header-controls">
                     <div class="progress-badge" id="progress-badge">
                         <span>📈</span>
@@ -1182,17 +1540,11 @@ def generate_html(course_data, course_name):
             <div class="video-wrapper">
                 <div class="video-container" id="video-container">
                     <div class="welcome-screen" id="welcome-screen">
-                        <svg viewBox="0 0 24 24" fill="currentColor">
-                            <path d="M8 5v14l11-7z"/>
-                        </svg>
-                        <h2>Welcome to {course_name}</h2>
+                        <svg viewBox="0 0 24 24" fill="currentColor"><use href="#i-play"/></svg>
+                        <h2>Welcome to __COURSE_NAME__</h2>
                         <p>Select a video from the sidebar to begin</p>
                     </div>
 
-                    <video id="video-player" style="display: none;" preload="metadata">
-                        <track id="subtitle-track" kind="captions" srclang="en" label="English">
-                    </video>
-
                     <div class="loading-spinner" id="loading-spinner"></div>
                     <div class="speed-toast" id="speed-toast"></div>
 
@@ -1201,6 +1553,7 @@ def generate_html(course_data, course_name):
                         <!-- Progress Bar -->
                         <div class="progress-bar-container" id="progress-container">
                             <div class="progress-bar" id="progress-bar"></div>
+                            <div class="progress-knob" id="progress-knob"></div>
                             <div class="progress-tooltip" id="progress-tooltip">0:00</div>
                         </div>
 
@@ -1208,37 +1561,23 @@ def generate_html(course_data, course_name):
                         <div class="controls-row">
                             <!-- Play/Pause -->
                             <button class="control-button play-pause" id="play-pause-btn" title="Play/Pause (Space)">
-                                <svg viewBox="0 0 24 24" id="play-icon">
-                                    <path d="M8 5v14l11-7z"/>
-                                </svg>
-                                <svg viewBox="0 0 24 24" id="pause-icon" style="display: none;">
-                                    <path d="M6 4h4v16H6V4zm8 0h4v16h-4V4z"/>
-                                </svg>
+                                <svg viewBox="0 0 24 24"><use id="play-pause-icon" href="#i-play"/></svg>
                             </button>
 
                             <!-- Previous -->
                             <button class="control-button" id="prev-btn" title="Previous Video">
-                                <svg viewBox="0 0 24 24">
-                                    <path d="M6 6h2v12H6zm3.5 6l8.5 6V6z"/>
-                                </svg>
+                                <svg viewBox="0 0 24 24"><use href="#i-prev"/></svg>
                             </button>
 
                             <!-- Next -->
                             <button class="control-button" id="next-btn" title="Next Video">
-                                <svg viewBox="0 0 24 24">
-                                    <path d="M16 18h2V6h-2v12zM6 18l8.5-6L6 6v12z"/>
-                                </svg>
+                                <svg viewBox="0 0 24 24"><use href="#i-next"/></svg>
                             </button>
 
                             <!-- Volume Control -->
                             <div class="volume-control">
                                 <button class="control-button" id="volume-btn" title="Mute/Unmute">
-                                    <svg viewBox="0 0 24 24" id="volume-icon">
-                                        <path d="M3 9v6h4l5 5V4L7 9H3zm13.5 3c0-1.77-1.02-3.29-2.5-4.03v8.05c1.48-.73 2.5-2.25 2.5-4.02z"/>
-                                    </svg>
-                                    <svg viewBox="0 0 24 24" id="mute-icon" style="display: none;">
-                                        <path d="M16.5 12c0-1.77-1.02-3.29-2.5-4.03v2.21l2.45 2.45c.03-.2.05-.41.05-.63zm2.5 0c0 .94-.2 1.82-.54 2.64l1.51 1.51C20.63 14.91 21 13.5 21 12c0-4.28-2.99-7.86-7-8.77v2.06c2.89.86 5 3.54 5 6.71zM4.27 3L3 4.27 7.73 9H3v6h4l5 5v-6.73l4.25 4.25c-.67.52-1.42.93-2.25 1.18v2.06c1.38-.31 2.63-.95 3.69-1.81L19.73 21 21 19.73l-9-9L4.27 3zM12 4L9.91 6.09 12 8.18V4z"/>
-                                    </svg>
+                                    <svg viewBox="0 0 24 24"><use id="volume-icon" href="#i-volume"/></svg>
                                 </button>
                                 <input type="range" class="volume-slider" id="volume-slider" min="0" max="100" value="100">
                             </div>
@@ -1251,9 +1590,7 @@ def generate_html(course_data, course_name):
                             <!-- Subtitles/CC -->
                             <div class="cc-menu">
                                 <button class="control-button" id="cc-btn" title="Closed Captions">
-                                    <svg viewBox="0 0 24 24">
-                                        <path d="M19 4H5c-1.11 0-2 .9-2 2v12c0 1.1.89 2 2 2h14c1.1 0 2-.9 2-2V6c0-1.1-.9-2-2-2zm-8 7H9.5v-.5h-2v3h2V13H11v1c0 .55-.45 1-1 1H7c-.55 0-1-.45-1-1v-4c0-.55.45-1 1-1h3c.55 0 1 .45 1 1v1zm7 0h-1.5v-.5h-2v3h2V13H18v1c0 .55-.45 1-1 1h-3c-.55 0-1-.45-1-1v-4c0-.55.45-1 1-1h3c.55 0 1 .45 1 1v1z"/>
-                                    </svg>
+                                    <svg viewBox="0 0 24 24"><use href="#i-cc"/></svg>
                                 </button>
                                 <div class="cc-dropdown" id="cc-dropdown">
                                     <div class="cc-item" id="cc-toggle">Toggle On/Off</div>
@@ -1265,9 +1602,7 @@ def generate_html(course_data, course_name):
                             <!-- Settings (Speed) -->
                             <div class="settings-menu">
                                 <button class="control-button" id="settings-btn" title="Settings">
-                                    <svg viewBox="0 0 24 24">
-                                        <path d="M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58c.18-.14.23-.41.12-.61l-1.92-3.32c-.12-.22-.37-.29-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54c-.04-.24-.24-.41-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58c-.18.14-.23.41-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.56 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61l-2.01-1.58zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6z"/>
-                                    </svg>
+                                    <svg viewBox="0 0 24 24"><use href="#i-settings"/></svg>
                                 </button>
                                 <div class="settings-dropdown" id="settings-dropdown">
                                     <div class="settings-item" data-speed="0.25">0.25x</div>
@@ -1283,12 +1618,7 @@ def generate_html(course_data, course_name):
 
                             <!-- Fullscreen -->
                             <button class="control-button" id="fullscreen-btn" title="Fullscreen (F)">
-                                <svg viewBox="0 0 24 24" id="fullscreen-icon">
-                                    <path d="M7 14H5v5h5v-2H7v-3zm-2-4h2V7h3V5H5v5zm12 7h-3v2h5v-5h-2v3zM14 5v2h3v3h2V5h-5z"/>
-                                </svg>
-                                <svg viewBox="0 0 24 24" id="fullscreen-exit-icon" style="display: none;">
-                                    <path d="M5 16h3v3h2v-5H5v2zm3-8H5v2h5V5H8v3zm6 11h2v-3h3v-2h-5v5zm2-11V5h-2v5h5V8h-3z"/>
-                                </svg>
+                                <svg viewBox="0 0 24 24"><use id="fullscreen-icon" href="#i-fullscreen"/></svg>
                             </button>
                         </div>
                     </div>
@@ -1316,43 +1646,69 @@ def generate_html(course_data, course_name):
     </div>
 
     <script>
-        // Course data embedded from Python
-        const courseData = {course_json};
+        // Course data embedded from Python, as parallel per-video arrays
+        // (see course_payload), unpacked once into sections of video objects
+        const coursePayload = __COURSE_JSON__;
+        const courseData = decodeCourse(coursePayload);
+        const courseResources = coursePayload.resources;
         
         // Watched videos injected from server
-        let watchedVideos = {watched_json};
+        let watchedVideos = new Set(__WATCHED_JSON__);
 
         // State
         let currentVideo = null;
         let currentSection = null;
+        let currentVideoIndex = -1;       // position of currentVideo in videoList
         let videoList = [];
+        let videoEntryByPath = new Map(); // video path -> { section, video, index }
+        let sectionCounts = new Map();    // section name -> { watched, total }
+        let sectionElements = new Map();  // section name -> { section, header, progress, list, mounted }
+        let videoItemByPath = new Map();  // video path -> { item, checkmark }, for mounted sections
+        let highlighted = null;           // { item, header } of the active video
+        let lastHighlightTime = 0;
         let isDraggingProgress = false;
         let isFullscreen = false;
         let isResizing = false;
         let startX = 0;
         let startWidth = 0;
+        let isHoveringProgress = false;
+        let progressRect = null;          // progress bar box, cached while hovered or dragged
+        let pendingMove = null;           // latest mousemove, handled on the next frame
+        let moveFrame = 0;
         let inactivityTimer = null;
-        let isControlsVisible = true;
+        let lastFullscreenMouseMove = 0;
+        let isControlsVisible = false;   // fullscreen controls pinned visible, see setControlsVisible()
+
+        // Created by createVideoPlayer() when the first video is loaded
+        let videoPlayer = null;
+        let subtitleTrack = null;
+
+        // Subtitle of the current video, fetched only once captions are turned on
+        let pendingSubtitleUrl = null;
+
+        // Blob URL of a subtitle file loaded from disk, revoked once replaced
+        let subtitleBlobUrl = null;
+
+        // Off-screen <video> that fetches the next video's metadata ahead of time
+        let nextVideoPreloader = null;
+        let preloadedPath = null;
 
         // DOM Elements
         const sidebar = document.getElementById('sidebar');
         const resizer = document.getElementById('resizer');
         const sectionsContainer = document.getElementById('sections-container');
         const videoContainer = document.getElementById('video-container');
-        const videoPlayer = document.getElementById('video-player');
         const welcomeScreen = document.getElementById('welcome-screen');
         const videoInfo = document.getElementById('video-info');
         const videoTitle = document.getElementById('video-title');
         const videoSection = document.getElementById('video-section');
         const videoControls = document.getElementById('video-controls');
         const playPauseBtn = document.getElementById('play-pause-btn');
-        const playIcon = document.getElementById('play-icon');
-        const pauseIcon = document.getElementById('pause-icon');
+        const playPauseIcon = document.getElementById('play-pause-icon');
         const prevBtn = document.getElementById('prev-btn');
         const nextBtn = document.getElementById('next-btn');
         const volumeBtn = document.getElementById('volume-btn');
         const volumeIcon = document.getElementById('volume-icon');
-        const muteIcon = document.getElementById('mute-icon');
         const volumeSlider = document.getElementById('volume-slider');
         const ccBtn = document.getElementById('cc-btn');
         const ccDropdown = document.getElementById('cc-dropdown');
@@ -1363,315 +1719,422 @@ def generate_html(course_data, course_name):
         const settingsDropdown = document.getElementById('settings-dropdown');
         const fullscreenBtn = document.getElementById('fullscreen-btn');
         const fullscreenIcon = document.getElementById('fullscreen-icon');
-        const fullscreenExitIcon = document.getElementById('fullscreen-exit-icon');
         const speedToast = document.getElementById('speed-toast');
         const timeDisplay = document.getElementById('time-display');
         const progressContainer = document.getElementById('progress-container');
         const progressBar = document.getElementById('progress-bar');
+        const progressKnob = document.getElementById('progress-knob');
         const progressTooltip = document.getElementById('progress-tooltip');
         const courseStats = document.getElementById('course-stats');
         const loadingSpinner = document.getElementById('loading-spinner');
-        const subtitleTrack = document.getElementById('subtitle-track');
         const resourcesBtn = document.getElementById('resources-btn');
         const resourcesPanel = document.getElementById('resources-panel');
         const resourcesList = document.getElementById('resources-list');
         const resetProgressBtn = document.getElementById('reset-progress-btn');
 
+        // Speed menu entries keyed by playback rate, and the highlighted one
+        const speedItems = new Map(Array.from(
+            settingsDropdown.querySelectorAll('.settings-item'),
+            item => [parseFloat(item.dataset.speed), item]
+        ));
+        let activeSpeedItem = settingsDropdown.querySelector('.settings-item.active');
+
+        // Rebuild { sectionName: { videos: [...] } } from the embedded arrays
+        function decodeCourse(payload) {
+            const data = {};
+            payload.sections.forEach((sectionName, s) => {
+                const videos = [];
+                for (let i = payload.starts[s]; i < payload.starts[s + 1]; i++) {
+                    videos.push({
+                        name: payload.names[i],
+                        path: payload.paths[i],
+                        url: payload.urls[i],
+                        subtitle_url: payload.subtitle_urls[i],
+                        resource_dir: payload.resource_dirs[i]
+                    });
+                }
+                data[sectionName] = { videos };
+            });
+            return data;
+        }
+
         // Build flat list of all videos for navigation
-        function buildVideoList() {{
+        function buildVideoList() {
             videoList = [];
-            Object.entries(courseData).forEach(([sectionName, sectionData]) => {{
-                sectionData.videos.forEach(video => {{
-                    videoList.push({{
+            videoEntryByPath = new Map();
+            sectionCounts = new Map();
+            Object.entries(courseData).forEach(([sectionName, sectionData]) => {
+                let watched = 0;
+                sectionData.videos.forEach(video => {
+                    const entry = {
                         section: sectionName,
-                        video: video
-                    }});
-                }});
-            }});
-        }}
-
-        // Mark video as watched (server-side)
-        async function markAsWatched(videoPath) {{
-            try {{
-                const response = await fetch('/api/mark_watched', {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ path: videoPath }})
-                }});
-                
-                if (response.ok) {{
-                    // Add to local list
-                    if (!watchedVideos.includes(videoPath)) {{
-                        watchedVideos.push(videoPath);
-                        updateSidebarCheckmarks();
-                        updateStats();
-                    }}
-                }}
-            }} catch (error) {{
-                console.error('Error marking video as watched:', error);
-            }}
-        }}
-
-        // Toggle watched status (server-side)
-        async function toggleWatched(videoPath) {{
-            try {{
-                const response = await fetch('/api/toggle_watched', {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ path: videoPath }})
-                }});
-                
-                if (response.ok) {{
+                        video: video,
+                        index: videoList.length
+                    };
+                    videoList.push(entry);
+                    videoEntryByPath.set(video.path, entry);
+                    watched += watchedVideos.has(video.path);
+                });
+                sectionCounts.set(sectionName, { watched, total: sectionData.videos.length });
+            });
+        }
+
+        // Paths with an update still on its way to the server, with how many
+        // updates are outstanding for each. syncWatched leaves these alone.
+        const pendingWrites = new Map();
+        const BEACON_GRACE_MS = 2000;
+
+        function endPendingWrite(path) {
+            const count = pendingWrites.get(path) - 1;
+            if (count > 0) {
+                pendingWrites.set(path, count);
+            } else {
+                pendingWrites.delete(path);
+            }
+        }
+
+        // Send a progress update without waiting for the reply. sendBeacon
+        // also gets through while the page is being closed.
+        function postWatched(url, payload) {
+            const body = JSON.stringify(payload);
+            pendingWrites.set(payload.path, (pendingWrites.get(payload.path) || 0) + 1);
+            if (navigator.sendBeacon &&
+                navigator.sendBeacon(url, new Blob([body], { type: 'application/json' }))) {
+                // A beacon gives no reply, so allow it a moment to land
+                setTimeout(() => endPendingWrite(payload.path), BEACON_GRACE_MS);
+                return;
+            }
+            fetch(url, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: body,
+                keepalive: true
+            }).catch(error => {
+                console.error('Error saving progress:', error);
+            }).finally(() => endPendingWrite(payload.path));
+        }
+
+        // Mark video as watched (updates the page right away, then the server)
+        function markAsWatched(videoPath) {
+            setWatched(videoPath, true);
+            postWatched('/api/mark_watched', { path: videoPath });
+        }
+
+        // Toggle watched status (updates the page right away, then the server)
+        function toggleWatched(videoPath) {
+            const isWatched = !watchedVideos.has(videoPath);
+            setWatched(videoPath, isWatched);
+            postWatched('/api/toggle_watched', { path: videoPath, watched: isWatched });
+        }
+
+        // Re-read the watched list from the server, in case an update was lost.
+        // Paths with an update still in flight keep their local state, since
+        // the server may not have seen the change yet.
+        async function syncWatched() {
+            try {
+                const response = await fetch('/api/progress');
+                if (response.ok) {
                     const data = await response.json();
-                    
-                    // Update local list
-                    if (data.watched) {{
-                        if (!watchedVideos.includes(videoPath)) {{
-                            watchedVideos.push(videoPath);
-                        }}
-                    }} else {{
-                        watchedVideos = watchedVideos.filter(p => p !== videoPath);
-                    }}
-                    
-                    updateSidebarCheckmarks();
-                    updateStats();
-                }}
-            }} catch (error) {{
-                console.error('Error toggling watched status:', error);
-            }}
-        }}
+                    const serverWatched = new Set(data.watched);
+                    Array.from(watchedVideos).forEach(path => {
+                        if (!serverWatched.has(path) && !pendingWrites.has(path)) {
+                            setWatched(path, false);
+                        }
+                    });
+                    serverWatched.forEach(path => {
+                        if (!pendingWrites.has(path)) {
+                            setWatched(path, true);
+                        }
+                    });
+                }
+            } catch (error) {
+                console.error('Error syncing progress:', error);
+            }
+        }
 
         // Reset all progress (server-side)
-        async function resetProgress() {{
-            if (!confirm('Are you sure you want to reset all progress? This cannot be undone.')) {{
+        async function resetProgress() {
+            if (!confirm('Are you sure you want to reset all progress? This cannot be undone.')) {
                 return;
-            }}
+            }
             
-            try {{
-                const response = await fetch('/api/reset_progress', {{
+            try {
+                const response = await fetch('/api/reset_progress', {
                     method: 'POST'
-                }});
+                });
                 
-                if (response.ok) {{
-                    watchedVideos = [];
-                    updateSidebarCheckmarks();
-                    updateStats();
-                }}
-            }} catch (error) {{
+                if (response.ok) {
+                    watchedVideos.clear();
+                    sectionCounts.forEach(counts => {
+                        counts.watched = 0;
+                    });
+                    scheduleUIRefresh();
+                }
+            } catch (error) {
                 console.error('Error resetting progress:', error);
-            }}
-        }}
+            }
+        }
+
+        // Record a watched-state change and update only the parts of the
+        // sidebar it affects
+        function setWatched(videoPath, isWatched) {
+            if (watchedVideos.has(videoPath) === isWatched) {
+                return;
+            }
+            if (isWatched) {
+                watchedVideos.add(videoPath);
+            } else {
+                watchedVideos.delete(videoPath);
+            }
+
+            const entry = videoEntryByPath.get(videoPath);
+            if (entry) {
+                sectionCounts.get(entry.section).watched += isWatched ? 1 : -1;
+            }
+            scheduleUIRefresh(videoPath);
+        }
+
+        // Sidebar/stats updates are batched into the next animation frame, so
+        // several changes in a row cost a single DOM pass
+        let pendingFrame = 0;
+        let pendingFullRefresh = false;
+        const pendingVideoPaths = new Set();
+
+        // Queue a refresh for one video, or for the whole sidebar if no path is given
+        function scheduleUIRefresh(videoPath) {
+            if (videoPath === undefined) {
+                pendingFullRefresh = true;
+            } else {
+                pendingVideoPaths.add(videoPath);
+            }
+            if (pendingFrame) {
+                return;
+            }
+            pendingFrame = requestAnimationFrame(() => {
+                pendingFrame = 0;
+                if (pendingFullRefresh) {
+                    updateSidebarCheckmarks();
+                } else {
+                    const sections = new Set();
+                    pendingVideoPaths.forEach(path => {
+                        const entry = videoEntryByPath.get(path);
+                        if (entry) {
+                            updateVideoCheckmark(path);
+                            sections.add(entry.section);
+                        }
+                    });
+                    sections.forEach(updateSectionProgress);
+                }
+                pendingFullRefresh = false;
+                pendingVideoPaths.clear();
+                updateStats();
+            });
+        }
+
+        // Section progress badge: a checkmark (shown once complete) and the count
+        function buildProgressSpan() {
+            const progressSpan = document.createElement('span');
+            const checkmark = document.createElement('span');
+            checkmark.className = 'checkmark';
+            checkmark.textContent = '✓';
+            progressSpan.append(checkmark, '');
+            return progressSpan;
+        }
+
+        // Update one video's watched state in the sidebar
+        function updateVideoCheckmark(videoPath) {
+            const elements = videoItemByPath.get(videoPath);
+            if (!elements) return;  // section not opened yet, built with the current state later
+            const { item, checkmark } = elements;
+            const isWatched = watchedVideos.has(videoPath);
+            item.classList.toggle('watched', isWatched);
+            checkmark.textContent = isWatched ? '✓' : '';
+        }
+
+        // Update a section's progress badge and completed state in place
+        function updateSectionProgress(sectionName) {
+            const { watched, total } = sectionCounts.get(sectionName);
+            const { header, progress } = sectionElements.get(sectionName);
+            const isComplete = watched === total && total > 0;
+
+            header.classList.toggle('completed', isComplete);
+            progress.className = `section-progress ${isComplete ? 'completed' : 'in-progress'}`;
+            progress.lastChild.data = `${watched}/${total}`;
+        }
 
         // Update checkmarks in sidebar
-        function updateSidebarCheckmarks() {{
-            document.querySelectorAll('.video-item').forEach(item => {{
-                const videoPath = item.dataset.path;
-                const isWatched = watchedVideos.includes(videoPath);
-                
-                if (isWatched) {{
-                    item.classList.add('watched');
-                }} else {{
-                    item.classList.remove('watched');
-                }}
-                
-                // Update checkmark
-                const checkmark = item.querySelector('.video-checkmark');
-                if (checkmark) {{
-                    checkmark.textContent = isWatched ? '✓' : '';
-                }}
-            }});
-            
-            // Update section progress indicators and completed state
-            document.querySelectorAll('.section').forEach(section => {{
-                const sectionHeader = section.querySelector('.section-header');
-                const sectionTitle = sectionHeader.querySelector('.section-title');
-                const videoItems = section.querySelectorAll('.video-item');
-                
-                const totalVideos = videoItems.length;
-                const watchedCount = Array.from(videoItems).filter(item => 
-                    watchedVideos.includes(item.dataset.path)
-                ).length;
-                const isComplete = watchedCount === totalVideos && totalVideos > 0;
-                
-                // Remove old progress indicator
-                const oldProgress = sectionTitle.querySelector('.section-progress');
-                if (oldProgress) {{
-                    oldProgress.remove();
-                }}
-                
-                // Create new progress indicator
-                const progressSpan = document.createElement('span');
-                progressSpan.className = `section-progress ${{isComplete ? 'completed' : 'in-progress'}}`;
-                
-                if (isComplete) {{
-                    progressSpan.innerHTML = `<span class="checkmark">✓</span>${{watchedCount}}/${{totalVideos}}`;
-                }} else {{
-                    progressSpan.textContent = `${{watchedCount}}/${{totalVideos}}`;
-                }}
-                
-                sectionTitle.appendChild(progressSpan);
-                
-                // Add or remove completed class on section header
-                if (isComplete) {{
-                    sectionHeader.classList.add('completed');
-                }} else {{
-                    sectionHeader.classList.remove('completed');
-                }}
-            }});
-        }}
+        function updateSidebarCheckmarks() {
+            videoItemByPath.forEach((elements, videoPath) => updateVideoCheckmark(videoPath));
+            sectionElements.forEach((elements, sectionName) => updateSectionProgress(sectionName));
+        }
 
         // Initialize UI
-        function init() {{
+        function init() {
             buildVideoList();
             renderSidebar();
             updateStats();
             setupEventListeners();
-        }}
+        }
 
         // Render sidebar sections
-        function renderSidebar() {{
-            sectionsContainer.innerHTML = '';
-
-            Object.entries(courseData).forEach(([sectionName, sectionData]) => {{
+        function renderSidebar() {
+            // Build everything off-document and insert it in one go
+            const fragment = document.createDocumentFragment();
+            sectionElements = new Map();
+            videoItemByPath = new Map();
+            highlighted = null;
+
+            Object.keys(courseData).forEach(sectionName => {
                 const section = document.createElement('div');
                 section.className = 'section';
-
-                // Calculate section progress
-                const totalVideos = sectionData.videos.length;
-                const watchedCount = sectionData.videos.filter(v => watchedVideos.includes(v.path)).length;
-                const isComplete = watchedCount === totalVideos && totalVideos > 0;
-                
-                // Create progress indicator HTML
-                let progressHTML = '';
-                if (isComplete) {{
-                    progressHTML = `<span class="section-progress completed"><span class="checkmark">✓</span>${{watchedCount}}/${{totalVideos}}</span>`;
-                }} else if (watchedCount > 0) {{
-                    progressHTML = `<span class="section-progress in-progress">${{watchedCount}}/${{totalVideos}}</span>`;
-                }} else {{
-                    progressHTML = `<span class="section-progress in-progress">0/${{totalVideos}}</span>`;
-                }}
+                section.dataset.section = sectionName;
 
                 const header = document.createElement('div');
                 header.className = 'section-header';
                 
-                // Add completed class if all videos are watched
-                if (isComplete) {{
-                    header.classList.add('completed');
-                }}
-                
-                header.innerHTML = `
-                    <span class="section-title">
-                        ${{sectionName}}
-                        ${{progressHTML}}
-                    </span>
-                    <span class="section-arrow">▶</span>
-                `;
+                const progress = buildProgressSpan();
+                const title = document.createElement('span');
+                title.className = 'section-title';
+                title.textContent = sectionName;
+                title.appendChild(progress);
 
+                const arrow = document.createElement('span');
+                arrow.className = 'section-arrow';
+                arrow.textContent = '▶';
+
+                header.append(title, arrow);
+
+                // Video items are created when the section is first expanded
                 const videoListDiv = document.createElement('div');
                 videoListDiv.className = 'video-list';
 
-                sectionData.videos.forEach(video => {{
-                    const videoItem = document.createElement('div');
-                    videoItem.className = 'video-item';
-                    videoItem.dataset.section = sectionName;
-                    videoItem.dataset.path = video.path;
-                    
-                    // Check if watched
-                    if (watchedVideos.includes(video.path)) {{
-                        videoItem.classList.add('watched');
-                    }}
-                    
-                    // Create video name span
-                    const videoName = document.createElement('span');
-                    videoName.className = 'video-name';
-                    videoName.textContent = video.name;
-                    
-                    // Create checkmark
-                    const checkmark = document.createElement('div');
-                    checkmark.className = 'video-checkmark';
-                    checkmark.textContent = watchedVideos.includes(video.path) ? '✓' : '';
-                    checkmark.title = 'Toggle watched status';
-                    
-                    // Checkmark click - toggle without loading video
-                    checkmark.addEventListener('click', (e) => {{
-                        e.stopPropagation();
-                        toggleWatched(video.path);
-                    }});
-                    
-                    // Video name click - load video
-                    videoName.addEventListener('click', () => {{
-                        loadVideo(sectionName, video);
-                    }});
-                    
-                    videoItem.appendChild(videoName);
-                    videoItem.appendChild(checkmark);
-
-                    videoListDiv.appendChild(videoItem);
-                }});
-
-                header.addEventListener('click', () => {{
-                    section.classList.toggle('expanded');
-                }});
+                // Keep the elements progress updates touch, then fill them in
+                sectionElements.set(sectionName, { section, header, progress, list: videoListDiv, mounted: false });
+                updateSectionProgress(sectionName);
 
                 section.appendChild(header);
                 section.appendChild(videoListDiv);
-                sectionsContainer.appendChild(section);
-            }});
+                fragment.appendChild(section);
+            });
 
             // Auto-expand first section
-            if (sectionsContainer.firstChild) {{
-                sectionsContainer.firstChild.classList.add('expanded');
-            }}
-        }}
+            const [firstSection] = sectionElements.keys();
+            if (firstSection !== undefined) {
+                expandSection(firstSection);
+            }
+
+            sectionsContainer.replaceChildren(fragment);
+        }
+
+        // Create a section's video items, once
+        function mountSectionVideos(sectionName) {
+            const elements = sectionElements.get(sectionName);
+            if (elements.mounted) return;
+            elements.mounted = true;
+
+            const fragment = document.createDocumentFragment();
+            courseData[sectionName].videos.forEach(video => {
+                const videoItem = document.createElement('div');
+                videoItem.className = 'video-item';
+                videoItem.dataset.section = sectionName;
+                videoItem.dataset.path = video.path;
+                
+                // Check if watched
+                if (watchedVideos.has(video.path)) {
+                    videoItem.classList.add('watched');
+                }
+                
+                // Create video name span
+                const videoName = document.createElement('span');
+                videoName.className = 'video-name';
+                videoName.textContent = video.name;
+                
+                // Create checkmark
+                const checkmark = document.createElement('div');
+                checkmark.className = 'video-checkmark';
+                checkmark.textContent = watchedVideos.has(video.path) ? '✓' : '';
+                checkmark.title = 'Toggle watched status';
+                
+                videoItem.appendChild(videoName);
+                videoItem.appendChild(checkmark);
+
+                fragment.appendChild(videoItem);
+                videoItemByPath.set(video.path, { item: videoItem, checkmark });
+            });
+            elements.list.appendChild(fragment);
+        }
+
+        // Open a section, building its video list if needed
+        function expandSection(sectionName) {
+            mountSectionVideos(sectionName);
+            sectionElements.get(sectionName).section.classList.add('expanded');
+        }
 
         // Update course statistics
-        function updateStats() {{
+        function updateStats() {
             const sectionCount = Object.keys(courseData).length;
             const videoCount = videoList.length;
-            const watchedCount = watchedVideos.length;
+            const watchedCount = watchedVideos.size;
             const percentage = videoCount > 0 ? Math.round((watchedCount / videoCount) * 100) : 0;
             
             // Update the blue progress badge
             const globalProgress = document.getElementById('global-progress');
-            if (globalProgress) {{
-                globalProgress.textContent = `${{percentage}}% Complete`;
-            }}
-        }}
+            if (globalProgress) {
+                globalProgress.textContent = `${percentage}% Complete`;
+            }
+        }
 
         // Load and play video
-        function loadVideo(sectionName, video) {{
+        function loadVideo(sectionName, video) {
             currentSection = sectionName;
             currentVideo = video;
+            currentVideoIndex = videoEntryByPath.get(video.path)?.index ?? -1;
 
             // Show loading
             loadingSpinner.classList.add('show');
 
+            if (!videoPlayer) {
+                createVideoPlayer();
+            }
+
             // Update UI
             welcomeScreen.style.display = 'none';
-            videoPlayer.style.display = 'block';
             videoInfo.style.display = 'block';
             videoControls.style.display = 'block';
 
+            // Stop warming up a video once it (or another one) is being played
+            cancelNextVideoPreload();
+
             // Set video source
-            videoPlayer.src = encodeURI(video.path);
+            videoPlayer.src = video.url;
 
-            // Handle subtitles
-            if (video.subtitle) {{
-                subtitleTrack.src = encodeURI(video.subtitle);
+            // Handle subtitles: only fetch them now if captions are already on
+            subtitleTrack.removeAttribute('src');
+            releaseSubtitleBlob();
+            pendingSubtitleUrl = video.subtitle_url;
+            if (video.subtitle_url) {
                 ccBtn.style.opacity = '0.9';
-            }} else {{
-                subtitleTrack.src = '';
+                if (videoPlayer.textTracks[0].mode === 'showing') {
+                    loadPendingSubtitle();
+                }
+            } else {
                 ccBtn.style.opacity = '0.5';
                 videoPlayer.textTracks[0].mode = 'hidden';
                 ccBtn.style.color = 'white';
                 ccToggle.classList.remove('active');
-            }}
+            }
 
-            videoPlayer.load();
+            // Setting src starts loading by itself; with preload="none"
+            // nothing is fetched until playback is requested. If the browser
+            // refuses autoplay, loadedmetadata never fires, so drop the spinner
+            // here; an AbortError just means another video replaced this one.
+            videoPlayer.play().catch(err => {
+                if (err.name !== 'AbortError') loadingSpinner.classList.remove('show');
+            });
 
             // Update info
             videoTitle.textContent = video.name;
-            videoSection.textContent = `Section: ${{sectionName}}`;
+            videoSection.textContent = `Section: ${sectionName}`;
 
             // Handle resources
             loadResources(video);
@@ -1681,534 +2144,775 @@ def generate_html(course_data, course_name):
 
             // Update navigation buttons
             updateNavigationButtons();
-        }}
+        }
 
         // Update sidebar to highlight current video
-        function updateSidebarHighlight() {{
-            document.querySelectorAll('.video-item').forEach(item => {{
-                item.classList.remove('active');
-            }});
-
-            document.querySelectorAll('.section-header').forEach(header => {{
-                header.classList.remove('active');
-            }});
-
-            if (currentVideo) {{
-                const activeItem = document.querySelector(
-                    `.video-item[data-path="${{currentVideo.path}}"]`
-                );
-                if (activeItem) {{
-                    activeItem.classList.add('active');
-
-                    const section = activeItem.closest('.section');
-                    if (section) {{
-                        section.classList.add('expanded');
-                        section.querySelector('.section-header').classList.add('active');
-                    }}
-
-                    activeItem.scrollIntoView({{ block: 'nearest', behavior: 'smooth' }});
-                }}
-            }}
-        }}
+        function updateSidebarHighlight() {
+            if (highlighted) {
+                highlighted.item.classList.remove('active');
+                highlighted.header.classList.remove('active');
+                highlighted = null;
+            }
+
+            if (currentVideo) {
+                expandSection(currentSection);
+                const { item } = videoItemByPath.get(currentVideo.path);
+                const { header } = sectionElements.get(currentSection);
+
+                item.classList.add('active');
+                header.classList.add('active');
+                highlighted = { item, header };
+
+                // Jump instead of animating when videos are being skipped quickly
+                const now = performance.now();
+                const behavior = now - lastHighlightTime < 500 ? 'instant' : 'smooth';
+                lastHighlightTime = now;
+
+                // Measure after this frame's DOM updates, and scroll only if needed
+                requestAnimationFrame(() => {
+                    const itemRect = item.getBoundingClientRect();
+                    const sidebarRect = sidebar.getBoundingClientRect();
+                    if (itemRect.top < sidebarRect.top || itemRect.bottom > sidebarRect.bottom) {
+                        item.scrollIntoView({ block: 'nearest', behavior });
+                    }
+                });
+            }
+        }
 
         // Update navigation buttons state
-        function updateNavigationButtons() {{
-            const currentIndex = videoList.findIndex(
-                item => item.video.path === currentVideo?.path
-            );
+        function updateNavigationButtons() {
+            prevBtn.disabled = currentVideoIndex <= 0;
+            nextBtn.disabled = currentVideoIndex >= videoList.length - 1;
+        }
 
-            prevBtn.disabled = currentIndex <= 0;
-            nextBtn.disabled = currentIndex >= videoList.length - 1;
-        }}
+        // Folder whose resources are in the panel (null: the "none" message)
+        let renderedResourceDir;
 
         // Load and display resources for current video
-        function loadResources(video) {{
+        function loadResources(video) {
             // Hide resources panel initially
             resourcesPanel.classList.remove('show');
 
+            // Resources are stored once per folder
+            const resources = video.resource_dir
+                ? courseResources[video.resource_dir]
+                : null;
+
             // Check if video has resources
-            if (video.resources && video.resources.length > 0) {{
+            if (resources && resources.length > 0) {
                 // Enable button
                 resourcesBtn.disabled = false;
                 resourcesBtn.style.opacity = '1';
+            } else {
+                // Disable button if no resources
+                resourcesBtn.disabled = true;
+                resourcesBtn.style.opacity = '0.5';
+            }
+
+            // Videos in the same folder share a list, so it is often already there
+            const listKey = resources ? video.resource_dir : null;
+            if (listKey === renderedResourceDir) {
+                return;
+            }
+            renderedResourceDir = listKey;
 
-                // Populate resources list
-                resourcesList.innerHTML = '';
-                video.resources.forEach(resource => {{
+            // Populate resources list off-document, then swap it in at once
+            const fragment = document.createDocumentFragment();
+            if (resources && resources.length > 0) {
+                resources.forEach(resource => {
                     const resourceItem = document.createElement('div');
                     resourceItem.className = 'resource-item';
 
                     const link = document.createElement('a');
-                    link.href = encodeURI(resource.path);
+                    link.href = resource.url;
                     link.target = '_blank';
-                    link.innerHTML = `
-                        <span class="resource-icon">📄</span>
-                        <span>${{resource.name}}</span>
-                    `;
+
+                    const icon = document.createElement('span');
+                    icon.className = 'resource-icon';
+                    icon.textContent = '📄';
+                    const name = document.createElement('span');
+                    name.textContent = resource.name;
+                    link.append(icon, name);
 
                     resourceItem.appendChild(link);
-                    resourcesList.appendChild(resourceItem);
-                }});
-            }} else {{
-                // Disable button if no resources
-                resourcesBtn.disabled = true;
-                resourcesBtn.style.opacity = '0.5';
-                resourcesList.innerHTML = '<div class="resources-empty">No resources available for this video</div>';
-            }}
-        }}
+                    fragment.appendChild(resourceItem);
+                });
+            } else {
+                const empty = document.createElement('div');
+                empty.className = 'resources-empty';
+                empty.textContent = 'No resources available for this video';
+                fragment.appendChild(empty);
+            }
+            resourcesList.replaceChildren(fragment);
+        }
 
         // Toggle resources panel visibility
-        function toggleResources() {{
+        function toggleResources() {
             resourcesPanel.classList.toggle('show');
-        }}
+        }
 
         // Toggle play/pause
-        function togglePlayPause() {{
-            if (videoPlayer.paused) {{
-                videoPlayer.play();
-            }} else {{
+        function togglePlayPause() {
+            if (!videoPlayer) return;
+            if (videoPlayer.paused) {
+                videoPlayer.play().catch(err => {
+                    if (err.name !== 'AbortError') loadingSpinner.classList.remove('show');
+                });
+            } else {
                 videoPlayer.pause();
-            }}
-        }}
+            }
+        }
+
+        // Start fetching the next video's metadata and first bytes, so moving
+        // on to it (by hand or when this one ends) starts without a delay.
+        // Called from timeupdate once the current video has played a while,
+        // so skimming through videos doesn't download each following one.
+        function preloadNextVideo() {
+            const next = videoList[currentVideoIndex + 1];
+            if (!next || preloadedPath === next.video.path) return;
+
+            if (!nextVideoPreloader) {
+                nextVideoPreloader = document.createElement('video');
+                nextVideoPreloader.preload = 'metadata';
+                nextVideoPreloader.muted = true;
+            }
+            preloadedPath = next.video.path;
+            nextVideoPreloader.src = next.video.url;
+        }
+
+        function cancelNextVideoPreload() {
+            if (preloadedPath === null) return;
+            preloadedPath = null;
+            nextVideoPreloader.removeAttribute('src');
+            nextVideoPreloader.load();
+        }
 
         // Navigate to previous video
-        function playPrevious() {{
-            const currentIndex = videoList.findIndex(
-                item => item.video.path === currentVideo?.path
-            );
-            if (currentIndex > 0) {{
-                const prev = videoList[currentIndex - 1];
+        function playPrevious() {
+            if (currentVideoIndex > 0) {
+                const prev = videoList[currentVideoIndex - 1];
                 loadVideo(prev.section, prev.video);
-            }}
-        }}
+            }
+        }
 
         // Navigate to next video
-        function playNext() {{
-            const currentIndex = videoList.findIndex(
-                item => item.video.path === currentVideo?.path
-            );
-            if (currentIndex < videoList.length - 1) {{
-                const next = videoList[currentIndex + 1];
+        function playNext() {
+            if (currentVideoIndex < videoList.length - 1) {
+                const next = videoList[currentVideoIndex + 1];
                 loadVideo(next.section, next.video);
-            }}
-        }}
+            }
+        }
 
         // Toggle mute
-        function toggleMute() {{
+        function toggleMute() {
             videoPlayer.muted = !videoPlayer.muted;
             updateVolumeIcon();
-        }}
+        }
+
+        // Point an icon's <use> at another symbol of the sprite
+        function setIcon(iconUse, name) {
+            iconUse.setAttribute('href', `#i-${name}`);
+        }
 
         // Update volume icon
-        function updateVolumeIcon() {{
-            if (videoPlayer.muted || videoPlayer.volume === 0) {{
-                volumeIcon.style.display = 'none';
-                muteIcon.style.display = 'block';
-            }} else {{
-                volumeIcon.style.display = 'block';
-                muteIcon.style.display = 'none';
-            }}
-        }}
+        function updateVolumeIcon() {
+            if (videoPlayer.muted || videoPlayer.volume === 0) {
+                setIcon(volumeIcon, 'mute');
+            } else {
+                setIcon(volumeIcon, 'volume');
+            }
+        }
 
         // Change playback speed
-        function changeSpeed(speed) {{
+        function changeSpeed(speed) {
             videoPlayer.playbackRate = speed;
             showSpeedToast(speed);
 
             // Update active state in dropdown
-            document.querySelectorAll('.settings-item').forEach(item => {{
-                item.classList.remove('active');
-                if (parseFloat(item.dataset.speed) === speed) {{
-                    item.classList.add('active');
-                }}
-            }});
-        }}
+            if (activeSpeedItem) {
+                activeSpeedItem.classList.remove('active');
+            }
+            activeSpeedItem = speedItems.get(speed) || null;
+            if (activeSpeedItem) {
+                activeSpeedItem.classList.add('active');
+            }
+        }
 
         // Show speed change notification
-        function showSpeedToast(speed) {{
-            speedToast.textContent = `Speed: ${{speed}}x`;
+        function showSpeedToast(speed) {
+            speedToast.textContent = `Speed: ${speed}x`;
             speedToast.classList.add('show');
-            setTimeout(() => {{
+            setTimeout(() => {
                 speedToast.classList.remove('show');
-            }}, 1000);
-        }}
+            }, 1000);
+        }
 
         // Toggle fullscreen
-        function toggleFullscreen() {{
-            if (!isFullscreen) {{
-                if (videoContainer.requestFullscreen) {{
+        function toggleFullscreen() {
+            if (!isFullscreen) {
+                if (videoContainer.requestFullscreen) {
                     videoContainer.requestFullscreen();
-                }} else if (videoContainer.webkitRequestFullscreen) {{
+                } else if (videoContainer.webkitRequestFullscreen) {
                     videoContainer.webkitRequestFullscreen();
-                }} else if (videoContainer.mozRequestFullScreen) {{
-                    videoContainer.mozRequestFullScreen();
-                }} else if (videoContainer.msRequestFullscreen) {{
-                    videoContainer.msRequestFullscreen();
-                }}
-            }} else {{
-                if (document.exitFullscreen) {{
+                }
+            } else {
+                if (document.exitFullscreen) {
                     document.exitFullscreen();
-                }} else if (document.webkitExitFullscreen) {{
+                } else if (document.webkitExitFullscreen) {
                     document.webkitExitFullscreen();
-                }} else if (document.mozCancelFullScreen) {{
-                    document.mozCancelFullScreen();
-                }} else if (document.msExitFullscreen) {{
-                    document.msExitFullscreen();
-                }}
-            }}
-        }}
+                }
+            }
+        }
 
-        // Show controls and reset inactivity timer
-        function showControlsAndResetTimer() {{
-            if (isFullscreen) {{
-                videoControls.classList.add('always-show');
-                videoContainer.classList.remove('hide-cursor');
-                isControlsVisible = true;
-
-                // Clear existing timer
-                if (inactivityTimer) {{
+        // Entering or leaving fullscreen, however it was triggered (button, Esc, F11)
+        function onFullscreenChange() {
+            isFullscreen = !!(document.fullscreenElement || document.webkitFullscreenElement);
+            updateFullscreenIcon();
+            if (isFullscreen) {
+                showControlsAndResetTimer();
+            } else {
+                // Clear timer and hand the controls back to hover when exiting fullscreen
+                if (inactivityTimer) {
                     clearTimeout(inactivityTimer);
-                }}
-
-                // Set new timer to hide after 3 seconds
-                inactivityTimer = setTimeout(() => {{
-                    if (isFullscreen && !videoPlayer.paused) {{
-                        videoControls.classList.remove('always-show');
-                        videoContainer.classList.add('hide-cursor');
-                        isControlsVisible = false;
-                    }}
-                }}, 3000);
-            }}
-        }}
+                }
+                setControlsVisible(false);
+            }
+        }
+
+        // Show or hide the fullscreen controls and cursor, touching the DOM
+        // only when the state actually changes. Outside fullscreen the
+        // controls stay in the hidden state, which leaves them to the CSS
+        // hover rules (hide-cursor only applies to the fullscreen container).
+        function setControlsVisible(visible) {
+            if (visible === isControlsVisible) return;
+            isControlsVisible = visible;
+            videoControls.classList.toggle('always-show', visible);
+            videoContainer.classList.toggle('hide-cursor', !visible);
+        }
+
+        // Show controls and reset inactivity timer
+        function showControlsAndResetTimer() {
+            if (isFullscreen) {
+                setControlsVisible(true);
+                restartInactivityTimer();
+            }
+        }
+
+        // Hide the controls 3 seconds from now, replacing any earlier timer
+        function restartInactivityTimer() {
+            if (inactivityTimer) {
+                clearTimeout(inactivityTimer);
+            }
+            inactivityTimer = setTimeout(hideControls, 3000);
+        }
 
         // Hide controls immediately
-        function hideControls() {{
-            if (isFullscreen && !videoPlayer.paused) {{
-                videoControls.classList.remove('always-show');
-                videoContainer.classList.add('hide-cursor');
-                isControlsVisible = false;
-                if (inactivityTimer) {{
+        function hideControls() {
+            if (isFullscreen && videoPlayer && !videoPlayer.paused) {
+                setControlsVisible(false);
+                if (inactivityTimer) {
                     clearTimeout(inactivityTimer);
-                }}
-            }}
-        }}
+                }
+            }
+        }
+
+        // Point the track at the current video's subtitle file, if not done yet
+        function loadPendingSubtitle() {
+            if (pendingSubtitleUrl) {
+                subtitleTrack.src = pendingSubtitleUrl;
+                pendingSubtitleUrl = null;
+            }
+        }
 
         // Toggle subtitles
-        function toggleSubtitles() {{
+        function toggleSubtitles() {
             const track = videoPlayer.textTracks[0];
+            loadPendingSubtitle();
             // Check if subtitles are loaded
-            if (!subtitleTrack.src) {{
+            if (!subtitleTrack.getAttribute('src')) {
                 alert('No subtitles loaded. Please load a subtitle file first.');
                 ccDropdown.classList.remove('show');
                 return;
-            }}
+            }
 
-            if (track.mode === 'hidden') {{
+            if (track.mode === 'hidden') {
                 track.mode = 'showing';
                 ccBtn.style.color = '#4fc3f7';
                 ccToggle.classList.add('active');
-            }} else {{
+            } else {
                 track.mode = 'hidden';
                 ccBtn.style.color = 'white';
                 ccToggle.classList.remove('active');
-            }}
-        }}
+            }
+        }
+
+        // HH:MM:SS of an SRT timestamp followed by its comma; the milliseconds
+        // are only looked ahead at, so the replacement copies less text
+        const SRT_TIMESTAMP_COMMA = /(\d\d:\d\d:\d\d),(?=\d\d\d)/g;
 
         // Convert SRT content to VTT format
-        function srtToVtt(srtContent) {{
-            // Add WebVTT header
-            let vttContent = 'WEBVTT\\n\\n';
+        function srtToVtt(srtContent) {
+            // WebVTT header, then timestamps with a period instead of SRT's comma
+            return 'WEBVTT\n\n' + srtContent.replace(SRT_TIMESTAMP_COMMA, '$1.');
+        }
 
-            // Replace comma with period in timestamps (SRT uses comma, VTT uses period)
-            vttContent += srtContent.replace(/(\d{{2}}:\d{{2}}:\d{{2}}),(\d{{3}})/g, '$1.$2');
+        // Free the Blob behind a previously loaded subtitle file
+        function releaseSubtitleBlob() {
+            if (subtitleBlobUrl) {
+                URL.revokeObjectURL(subtitleBlobUrl);
+                subtitleBlobUrl = null;
+            }
+        }
 
-            return vttContent;
-        }}
+        // Reads a subtitle file and converts SRT to VTT off the main thread,
+        // so multi-megabyte files don't freeze the page. Built from the
+        // srtToVtt function and regex above; null where workers are unavailable.
+        let subtitleWorker;
+
+        function getSubtitleWorker() {
+            if (subtitleWorker !== undefined) return subtitleWorker;
+            subtitleWorker = null;
+            let sourceUrl = null;
+            try {
+                const source = `const SRT_TIMESTAMP_COMMA = ${SRT_TIMESTAMP_COMMA};
+${srtToVtt}
+self.onmessage = async (e) => {
+    const file = e.data;
+    try {
+        let content = await file.text();
+        if (file.name.toLowerCase().endsWith('.srt')) {
+            content = srtToVtt(content);
+        }
+        self.postMessage({ name: file.name, blob: new Blob([content], { type: 'text/vtt' }) });
+    } catch (err) {
+        self.postMessage({ name: file.name, error: String(err) });
+    }
+};`;
+                sourceUrl = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+                const worker = new Worker(sourceUrl);
+                worker.onmessage = (e) => {
+                    if (e.data.error) {
+                        subtitleLoadFailed(e.data.error);
+                    } else {
+                        applySubtitleBlob(e.data.blob, e.data.name);
+                    }
+                };
+                worker.onerror = (e) => subtitleLoadFailed(e.message);
+                subtitleWorker = worker;
+            } catch (e) {
+                console.warn('Subtitle worker unavailable, converting on the page:', e);
+                if (sourceUrl) URL.revokeObjectURL(sourceUrl);
+            }
+            return subtitleWorker;
+        }
 
-        // Load custom subtitle file
-        function loadSubtitleFile(file) {{
-            const reader = new FileReader();
+        // Show a converted subtitle Blob on the current video
+        function applySubtitleBlob(blob, fileName) {
+            // Create Blob URL
+            const blobUrl = URL.createObjectURL(blob);
 
-            reader.onload = function(e) {{
-                let content = e.target.result;
-                const fileName = file.name.toLowerCase();
+            // Update subtitle track
+            releaseSubtitleBlob();
+            subtitleBlobUrl = blobUrl;
+            subtitleTrack.src = blobUrl;
+            pendingSubtitleUrl = null;
 
-                // Convert SRT to VTT if needed
-                if (fileName.endsWith('.srt')) {{
-                    content = srtToVtt(content);
-                }}
+            // Enable CC button with full opacity
+            ccBtn.style.opacity = '0.9';
 
-                // Create Blob URL
-                const blob = new Blob([content], {{ type: 'text/vtt' }});
-                const blobUrl = URL.createObjectURL(blob);
+            // Auto-enable subtitles
+            videoPlayer.textTracks[0].mode = 'showing';
+            ccBtn.style.color = '#4fc3f7';
+            ccToggle.classList.add('active');
 
-                // Update subtitle track
-                subtitleTrack.src = blobUrl;
+            // Close the dropdown
+            ccDropdown.classList.remove('show');
 
-                // Enable CC button with full opacity
-                ccBtn.style.opacity = '0.9';
+            console.log('Subtitle loaded successfully:', fileName);
+        }
 
-                // Auto-enable subtitles
-                videoPlayer.textTracks[0].mode = 'showing';
-                ccBtn.style.color = '#4fc3f7';
-                ccToggle.classList.add('active');
+        function subtitleLoadFailed(reason) {
+            console.error('Error reading subtitle file', reason || '');
+            alert('Failed to load subtitle file. Please try again.');
+        }
 
-                // Close the dropdown
-                ccDropdown.classList.remove('show');
+        // Load custom subtitle file
+        function loadSubtitleFile(file) {
+            const worker = getSubtitleWorker();
+            if (worker) {
+                worker.postMessage(file);
+                return;
+            }
+
+            const reader = new FileReader();
+
+            reader.onload = function(e) {
+                let content = e.target.result;
 
-                console.log('Subtitle loaded successfully:', file.name);
-            }};
+                // Convert SRT to VTT if needed
+                if (file.name.toLowerCase().endsWith('.srt')) {
+                    content = srtToVtt(content);
+                }
+
+                applySubtitleBlob(new Blob([content], { type: 'text/vtt' }), file.name);
+            };
 
-            reader.onerror = function() {{
-                console.error('Error reading subtitle file');
-                alert('Failed to load subtitle file. Please try again.');
-            }};
+            reader.onerror = function() {
+                subtitleLoadFailed();
+            };
 
             reader.readAsText(file);
-        }}
+        }
+
+        // '00' to '59', for the minute and second fields of formatTime()
+        const TWO_DIGITS = Array.from({ length: 60 }, (_, i) => String(i).padStart(2, '0'));
 
         // Format time (seconds to MM:SS or HH:MM:SS)
-        function formatTime(seconds) {{
+        function formatTime(seconds) {
             if (isNaN(seconds)) return '0:00';
 
             const h = Math.floor(seconds / 3600);
             const m = Math.floor((seconds % 3600) / 60);
             const s = Math.floor(seconds % 60);
 
-            if (h > 0) {{
-                return `${{h}}:${{m.toString().padStart(2, '0')}}:${{s.toString().padStart(2, '0')}}`;
-            }}
-            return `${{m}}:${{s.toString().padStart(2, '0')}}`;
-        }}
+            if (h > 0) {
+                return `${h}:${TWO_DIGITS[m]}:${TWO_DIGITS[s]}`;
+            }
+            return `${m}:${TWO_DIGITS[s]}`;
+        }
+
+        // Move the progress bar and its knob (fraction is 0..1)
+        function setProgress(fraction) {
+            progressBar.style.transform = `scaleX(${fraction})`;
+            progressKnob.style.transform = `translateX(${fraction * 100}%)`;
+        }
+
+        // Last values written by updateProgress, so timeupdate events that
+        // would not change what is on screen skip the DOM writes
+        let lastProgressPermille = -1;
+        let lastProgressSecond = -1;
+        let lastProgressDuration = -1;
+        let durationText = '0:00';        // formatTime(lastProgressDuration)
 
         // Update progress bar
-        function updateProgress() {{
-            if (!isDraggingProgress) {{
-                const percent = (videoPlayer.currentTime / videoPlayer.duration) * 100;
-                progressBar.style.width = percent + '%';
-            }}
-            timeDisplay.textContent = `${{formatTime(videoPlayer.currentTime)}} / ${{formatTime(videoPlayer.duration)}}`;
-        }}
+        function updateProgress() {
+            const duration = videoPlayer.duration;
+            const permille = (videoPlayer.currentTime / duration * 1000) | 0;
+            if (!isDraggingProgress && permille !== lastProgressPermille) {
+                lastProgressPermille = permille;
+                setProgress(permille / 1000);
+            }
+
+            const second = videoPlayer.currentTime | 0;
+            if (duration !== lastProgressDuration) {
+                lastProgressDuration = duration;
+                durationText = formatTime(duration);
+                lastProgressSecond = -1;
+            }
+            if (second !== lastProgressSecond) {
+                lastProgressSecond = second;
+                timeDisplay.textContent = `${formatTime(second)} / ${durationText}`;
+            }
+        }
+
+        // Progress bar box, measured once per hover or drag instead of per event
+        function getProgressRect() {
+            if (!progressRect) {
+                progressRect = progressContainer.getBoundingClientRect();
+            }
+            return progressRect;
+        }
 
         // Seek video
-        function seekVideo(e) {{
-            const rect = progressContainer.getBoundingClientRect();
-            const percent = (e.clientX - rect.left) / rect.width;
+        function seekVideo(e) {
+            const rect = getProgressRect();
+            const percent = Math.min(1, Math.max(0, (e.clientX - rect.left) / rect.width));
             const time = percent * videoPlayer.duration;
             videoPlayer.currentTime = time;
-            progressBar.style.width = (percent * 100) + '%';
-        }}
+            setProgress(percent);
+            lastProgressPermille = -1;
+        }
 
         // Show time tooltip on progress bar hover
-        function showProgressTooltip(e) {{
-            const rect = progressContainer.getBoundingClientRect();
+        function showProgressTooltip(e) {
+            const rect = getProgressRect();
             const percent = (e.clientX - rect.left) / rect.width;
             const time = percent * videoPlayer.duration;
             progressTooltip.textContent = formatTime(time);
             progressTooltip.style.left = (e.clientX - rect.left) + 'px';
-        }}
+        }
 
-        // Setup all event listeners
-        function setupEventListeners() {{
+        // Queue a mousemove; drag seeking, the tooltip and sidebar resizing
+        // run at most once per frame however fast the mouse reports
+        function scheduleMove(e) {
+            if (!isDraggingProgress && !isHoveringProgress && !isResizing) return;
+            pendingMove = { clientX: e.clientX };
+            if (!moveFrame) {
+                moveFrame = requestAnimationFrame(flushMove);
+            }
+        }
+
+        function flushMove() {
+            moveFrame = 0;
+            const e = pendingMove;
+            if (!e) return;
+            pendingMove = null;
+
+            if (isDraggingProgress) {
+                seekVideo(e);
+            }
+            if (isHoveringProgress) {
+                showProgressTooltip(e);
+            }
+            if (isResizing) {
+                const newWidth = startWidth + (e.clientX - startX);
+
+                // Apply constraints
+                if (newWidth >= 200 && newWidth <= 600) {
+                    sidebar.style.width = newWidth + 'px';
+                }
+            }
+        }
+
+        // Create the <video> element the first time a video is loaded, so
+        // the page makes no media requests before the user picks a video
+        function createVideoPlayer() {
+            videoPlayer = document.createElement('video');
+            videoPlayer.id = 'video-player';
+            videoPlayer.preload = 'none';
+
+            subtitleTrack = document.createElement('track');
+            subtitleTrack.id = 'subtitle-track';
+            subtitleTrack.kind = 'captions';
+            subtitleTrack.srclang = 'en';
+            subtitleTrack.label = 'English';
+            videoPlayer.appendChild(subtitleTrack);
+
+            videoContainer.insertBefore(videoPlayer, loadingSpinner);
+            setupVideoPlayerListeners();
+        }
+
+        // Listeners on the <video> element itself
+        function setupVideoPlayerListeners() {
             // Video player events
-            videoPlayer.addEventListener('play', () => {{
-                playIcon.style.display = 'none';
-                pauseIcon.style.display = 'block';
-                if (isFullscreen) {{
+            videoPlayer.addEventListener('play', () => {
+                setIcon(playPauseIcon, 'pause');
+                // Resume auto-hide when video plays
+                if (isFullscreen) {
                     showControlsAndResetTimer();
-                }}
-            }});
-
-            videoPlayer.addEventListener('pause', () => {{
-                playIcon.style.display = 'block';
-                pauseIcon.style.display = 'none';
-                if (isFullscreen) {{
-                    videoControls.classList.add('always-show');
-                    videoContainer.classList.remove('hide-cursor');
-                    if (inactivityTimer) {{
+                }
+            });
+
+            videoPlayer.addEventListener('pause', () => {
+                setIcon(playPauseIcon, 'play');
+                // Show controls when video is paused
+                if (isFullscreen) {
+                    setControlsVisible(true);
+                    if (inactivityTimer) {
                         clearTimeout(inactivityTimer);
-                    }}
-                }}
-            }});
+                    }
+                }
+            });
 
             videoPlayer.addEventListener('timeupdate', updateProgress);
 
-            videoPlayer.addEventListener('ended', () => {{
+            videoPlayer.addEventListener('timeupdate', () => {
+                if (videoPlayer.currentTime >= 5) {
+                    preloadNextVideo();
+                }
+            });
+
+            videoPlayer.addEventListener('ended', () => {
                 // Mark current video as watched
-                if (currentVideo) {{
+                if (currentVideo) {
                     markAsWatched(currentVideo.path);
-                }}
+                }
                 playNext();
-            }});
+            });
 
-            videoPlayer.addEventListener('loadedmetadata', () => {{
+            videoPlayer.addEventListener('loadedmetadata', () => {
                 loadingSpinner.classList.remove('show');
-                videoPlayer.play();
-            }});
+            });
 
             videoPlayer.addEventListener('volumechange', updateVolumeIcon);
+        }
+
+        // Setup all event listeners
+        function setupEventListeners() {
+            // Resync progress when coming back to the tab
+            document.addEventListener('visibilitychange', () => {
+                if (document.visibilityState === 'visible') {
+                    syncWatched();
+                }
+            });
+
+            // Sidebar clicks, delegated from the sections container
+            sectionsContainer.addEventListener('click', (e) => {
+                // Checkmark click - toggle without loading video
+                const checkmark = e.target.closest('.video-checkmark');
+                if (checkmark) {
+                    toggleWatched(checkmark.parentElement.dataset.path);
+                    return;
+                }
+
+                // Video name click - load video
+                const videoName = e.target.closest('.video-name');
+                if (videoName) {
+                    const entry = videoEntryByPath.get(videoName.parentElement.dataset.path);
+                    loadVideo(entry.section, entry.video);
+                    return;
+                }
+
+                // Section header click - expand/collapse
+                const header = e.target.closest('.section-header');
+                if (header) {
+                    const section = header.parentElement;
+                    if (section.classList.contains('expanded')) {
+                        section.classList.remove('expanded');
+                    } else {
+                        expandSection(section.dataset.section);
+                    }
+                }
+            });
 
             // Video container click = play/pause
-            videoContainer.addEventListener('click', (e) => {{
-                if (e.target === videoPlayer || e.target === videoContainer) {{
+            videoContainer.addEventListener('click', (e) => {
+                if (e.target === videoPlayer || e.target === videoContainer) {
                     togglePlayPause();
-                }}
-            }});
+                }
+            });
 
             // Double click = fullscreen
-            videoContainer.addEventListener('dblclick', (e) => {{
-                if (e.target === videoPlayer || e.target === videoContainer) {{
+            videoContainer.addEventListener('dblclick', (e) => {
+                if (e.target === videoPlayer || e.target === videoContainer) {
                     toggleFullscreen();
-                }}
-            }});
+                }
+            });
 
             // Control buttons
-            playPauseBtn.addEventListener('click', (e) => {{
+            playPauseBtn.addEventListener('click', (e) => {
                 e.stopPropagation();
                 togglePlayPause();
-            }});
+            });
 
             prevBtn.addEventListener('click', playPrevious);
-            nextBtn.addEventListener('click', () => {{
+            nextBtn.addEventListener('click', () => {
                 // Mark current video as watched when clicking Next
-                if (currentVideo) {{
+                if (currentVideo) {
                     markAsWatched(currentVideo.path);
-                }}
+                }
                 playNext();
-            }});
+            });
 
             volumeBtn.addEventListener('click', toggleMute);
 
-            volumeSlider.addEventListener('input', (e) => {{
+            volumeSlider.addEventListener('input', (e) => {
                 videoPlayer.volume = e.target.value / 100;
                 videoPlayer.muted = false;
-            }});
+            });
 
             // CC button and menu
-            ccBtn.addEventListener('click', (e) => {{
+            ccBtn.addEventListener('click', (e) => {
                 e.stopPropagation();
                 ccDropdown.classList.toggle('show');
                 settingsDropdown.classList.remove('show');
-            }});
+            });
 
-            ccToggle.addEventListener('click', () => {{
+            ccToggle.addEventListener('click', () => {
                 toggleSubtitles();
                 ccDropdown.classList.remove('show');
-            }});
+            });
 
-            ccLoad.addEventListener('click', () => {{
+            ccLoad.addEventListener('click', () => {
                 subtitleFileInput.click();
-            }});
+            });
 
-            subtitleFileInput.addEventListener('change', (e) => {{
+            subtitleFileInput.addEventListener('change', (e) => {
                 const file = e.target.files[0];
-                if (file) {{
+                if (file) {
                     loadSubtitleFile(file);
-                }}
+                }
                 // Reset input so same file can be selected again
                 e.target.value = '';
-            }});
+            });
 
             // Settings dropdown
-            settingsBtn.addEventListener('click', (e) => {{
+            settingsBtn.addEventListener('click', (e) => {
                 e.stopPropagation();
                 settingsDropdown.classList.toggle('show');
-            }});
+            });
 
-            document.querySelectorAll('.settings-item').forEach(item => {{
-                item.addEventListener('click', () => {{
-                    const speed = parseFloat(item.dataset.speed);
-                    changeSpeed(speed);
+            // Speed options, delegated from the dropdown
+            settingsDropdown.addEventListener('click', (e) => {
+                const item = e.target.closest('.settings-item');
+                if (item) {
+                    changeSpeed(parseFloat(item.dataset.speed));
                     settingsDropdown.classList.remove('show');
-                }});
-            }});
+                }
+            });
 
             // Close dropdowns on outside click
-            document.addEventListener('click', (e) => {{
-                if (!settingsBtn.contains(e.target) && !settingsDropdown.contains(e.target)) {{
+            document.addEventListener('click', (e) => {
+                if (!settingsBtn.contains(e.target) && !settingsDropdown.contains(e.target)) {
                     settingsDropdown.classList.remove('show');
-                }}
-                if (!ccBtn.contains(e.target) && !ccDropdown.contains(e.target)) {{
+                }
+                if (!ccBtn.contains(e.target) && !ccDropdown.contains(e.target)) {
                     ccDropdown.classList.remove('show');
-                }}
-            }});
+                }
+            });
 
             fullscreenBtn.addEventListener('click', toggleFullscreen);
 
-            // Fullscreen change events
-            document.addEventListener('fullscreenchange', () => {{
-                isFullscreen = !!document.fullscreenElement;
-                updateFullscreenIcon();
-                if (isFullscreen) {{
-                    showControlsAndResetTimer();
-                }} else {{
-                    // Clear timer and show controls when exiting fullscreen
-                    if (inactivityTimer) {{
-                        clearTimeout(inactivityTimer);
-                    }}
-                    videoControls.classList.remove('always-show');
-                    videoContainer.classList.remove('hide-cursor');
-                }}
-            }});
-
-            document.addEventListener('webkitfullscreenchange', () => {{
-                isFullscreen = !!document.webkitFullscreenElement;
-                updateFullscreenIcon();
-                if (isFullscreen) {{
-                    showControlsAndResetTimer();
-                }} else {{
-                    if (inactivityTimer) {{
-                        clearTimeout(inactivityTimer);
-                    }}
-                    videoControls.classList.remove('always-show');
-                    videoContainer.classList.remove('hide-cursor');
-                }}
-            }});
+            // Fullscreen change events (prefixed only in older Safari)
+            document.addEventListener(
+                'onfullscreenchange' in document ? 'fullscreenchange' : 'webkitfullscreenchange',
+                onFullscreenChange
+            );
 
             // Mouse movement in video container for fullscreen
-            videoContainer.addEventListener('mousemove', () => {{
-                if (isFullscreen) {{
-                    showControlsAndResetTimer();
-                }}
-            }});
-
-            // Show controls when video is paused
-            videoPlayer.addEventListener('pause', () => {{
-                if (isFullscreen) {{
-                    videoControls.classList.add('always-show');
-                    videoContainer.classList.remove('hide-cursor');
-                    if (inactivityTimer) {{
-                        clearTimeout(inactivityTimer);
-                    }}
-                }}
-            }});
+            // (at most every 100ms; controls already shown only need the timer pushed back)
+            videoContainer.addEventListener('mousemove', () => {
+                if (!isFullscreen) return;
+
+                const now = performance.now();
+                if (now - lastFullscreenMouseMove < 100) return;
+                lastFullscreenMouseMove = now;
 
-            // Resume auto-hide when video plays
-            videoPlayer.addEventListener('play', () => {{
-                if (isFullscreen) {{
+                if (isControlsVisible) {
+                    restartInactivityTimer();
+                } else {
                     showControlsAndResetTimer();
-                }}
-            }});
+                }
+            }, { passive: true });
 
             // Progress bar
             progressContainer.addEventListener('click', seekVideo);
 
-            progressContainer.addEventListener('mousedown', (e) => {{
+            progressContainer.addEventListener('mousedown', (e) => {
                 isDraggingProgress = true;
                 seekVideo(e);
-            }});
+            });
+
+            progressContainer.addEventListener('mouseenter', () => {
+                isHoveringProgress = true;
+                progressRect = null;
+            });
 
-            document.addEventListener('mousemove', (e) => {{
-                if (isDraggingProgress) {{
-                    seekVideo(e);
-                }}
-            }});
+            progressContainer.addEventListener('mouseleave', () => {
+                isHoveringProgress = false;
+            });
 
-            document.addEventListener('mouseup', () => {{
+            document.addEventListener('mouseup', () => {
                 isDraggingProgress = false;
-            }});
+            });
 
-            progressContainer.addEventListener('mousemove', showProgressTooltip);
+            // One handler for every mousemove-driven update, see scheduleMove()
+            // (passive: none of the pointer handlers call preventDefault)
+            document.addEventListener('mousemove', scheduleMove, { passive: true });
+
+            window.addEventListener('resize', () => {
+                progressRect = null;
+            });
 
             // Resources button
             resourcesBtn.addEventListener('click', toggleResources);
@@ -2217,40 +2921,32 @@ def generate_html(course_data, course_name):
             resetProgressBtn.addEventListener('click', resetProgress);
 
             // Resizer drag functionality
-            resizer.addEventListener('mousedown', (e) => {{
+            resizer.addEventListener('mousedown', (e) => {
                 isResizing = true;
                 startX = e.clientX;
                 startWidth = sidebar.offsetWidth;
                 document.body.classList.add('resizing');
                 e.preventDefault();
-            }});
-
-            document.addEventListener('mousemove', (e) => {{
-                if (!isResizing) return;
-
-                const delta = e.clientX - startX;
-                const newWidth = startWidth + delta;
-
-                // Apply constraints
-                if (newWidth >= 200 && newWidth <= 600) {{
-                    sidebar.style.width = newWidth + 'px';
-                }}
-            }});
+            });
 
-            document.addEventListener('mouseup', () => {{
-                if (isResizing) {{
+            document.addEventListener('mouseup', () => {
+                if (isResizing) {
                     isResizing = false;
                     document.body.classList.remove('resizing');
-                }}
-            }});
+                }
+            });
 
             // Keyboard shortcuts
-            document.addEventListener('keydown', (e) => {{
-                if (e.target.tagName === 'INPUT' || e.target.tagName === 'SELECT') {{
+            document.addEventListener('keydown', (e) => {
+                if (e.target.tagName === 'INPUT' || e.target.tagName === 'SELECT') {
                     return;
-                }}
+                }
+                // Nothing to control until the first video has been loaded
+                if (!videoPlayer) {
+                    return;
+                }
 
-                switch(e.key.toLowerCase()) {{
+                switch(e.key.toLowerCase()) {
                     case ' ':
                         e.preventDefault();
                         togglePlayPause();
@@ -2289,58 +2985,220 @@ def generate_html(course_data, course_name):
                         ccDropdown.classList.toggle('show');
                         settingsDropdown.classList.remove('show');
                         break;
-                }}
-            }});
-        }}
+                }
+            });
+        }
 
         // Update fullscreen icon
-        function updateFullscreenIcon() {{
-            if (isFullscreen) {{
-                fullscreenIcon.style.display = 'none';
-                fullscreenExitIcon.style.display = 'block';
+        function updateFullscreenIcon() {
+            if (isFullscreen) {
+                setIcon(fullscreenIcon, 'fullscreen-exit');
                 videoContainer.classList.add('fullscreen');
-            }} else {{
-                fullscreenIcon.style.display = 'block';
-                fullscreenExitIcon.style.display = 'none';
+            } else {
+                setIcon(fullscreenIcon, 'fullscreen');
                 videoContainer.classList.remove('fullscreen');
-            }}
-        }}
+            }
+        }
 
         // Initialize on page load
         init();
     </script>
 </body>
-</html>"""
+</html>""")
+
+def course_payload(course_data):
+    """
+    Flatten the course structure into parallel arrays for the page: one
+    entry per video in 'names', 'paths', 'urls', 'subtitle_urls' and
+    'resource_dirs', with section i covering indexes starts[i] to
+    starts[i + 1]. This avoids repeating the same keys for every video in
+    the embedded JSON. URLs are percent-encoded here once, so the page can
+    use them as they are; paths stay plain since they identify videos.
+    """
+    sections = []
+    starts = [0]
+    names = []
+    paths = []
+    urls = []
+    subtitle_urls = []
+    resource_dirs = []
+    resources = {}
+    for section_name, section in course_data.items():
+        sections.append(section_name)
+        for video in section['videos']:
+            names.append(video['name'])
+            paths.append(video['path'])
+            urls.append(quote(video['path']))
+            subtitle = video['subtitle']
+            subtitle_urls.append(quote(subtitle) if subtitle else None)
+            resource_dirs.append(video['resource_dir'])
+        starts.append(len(paths))
+        for resource_dir, resource_files in section['resources_by_dir'].items():
+            resources[resource_dir] = [{'name': resource['name'], 'url': quote(resource['path'])}
+                                       for resource in resource_files]
+    return {
+        'sections': sections,
+        'starts': starts,
+        'names': names,
+        'paths': paths,
+        'urls': urls,
+        'subtitle_urls': subtitle_urls,
+        'resource_dirs': resource_dirs,
+        'resources': resources,
+    }
 
+def generate_html(course_data, course_name):
+    """
+    Generate a complete HTML page with embedded CSS and JavaScript.
+    """
+    # Convert course data to JSON for embedding
+    course_json = json_dumps(course_payload(course_data))
+    
+    # Load watched videos for injection
+    with _PROGRESS_LOCK:
+        watched_videos = sorted(get_watched())
+    watched_json = json_dumps(watched_videos)
+
+    return _render_template(_PAGE_TEMPLATE, {
+        'COURSE_NAME': course_name,
+        'PAGE_CSS': _PAGE_STYLE,
+        'COURSE_JSON': course_json,
+        'WATCHED_JSON': watched_json,
+    })
+
+# Last rendered player page: ((watched version, scan generation), html bytes)
+_INDEX_CACHE = (None, None)
+
+def render_index(root_dir, course_name):
+    """
+    Return the player page as UTF-8 bytes.
+    The page is cached and only re-rendered when the watched list or the
+    course structure has changed (checking the latter costs a stat per
+    scanned directory; see current_scan).
+    """
+    global _INDEX_CACHE
+    generation, course_structure = current_scan(root_dir)
+    key = (_WATCHED_VERSION, generation)
+    cached_key, html = _INDEX_CACHE
+    if key != cached_key:
+        html = generate_html(course_structure, course_name).encode('utf-8')
+        _INDEX_CACHE = (key, html)
     return html
 
+# Single byte range request header, e.g. "bytes=0-1023", "bytes=500-" or "bytes=-500"
+_RANGE_RE = re.compile(r'bytes=(\d*)-(\d*)$')
+
+# How long (seconds) the browser may reuse course files without asking again.
+# Videos practically never change; subtitles are rechecked more often.
+_MAX_AGE_BY_EXT = {
+    **dict.fromkeys(VIDEO_EXTENSIONS, 86400),
+    **dict.fromkeys(SUBTITLE_EXTENSIONS, 3600),
+}
+
+def _file_etag(st):
+    """
+    ETag for a file on disk, from its modification time and size.
+    """
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+def _bytes_etag(data):
+    """
+    ETag for a generated response body.
+    """
+    return f'"{zlib.crc32(data):08x}-{len(data):x}"'
+
+_DEFERRED_STYLE_ETAG = _bytes_etag(_DEFERRED_STYLE)
+
 class CourseHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """
     Custom HTTP request handler to serve video files, handle subtitle conversion,
     and manage progress tracking API endpoints.
     """
+    # Cache-Control max-age for the file send_head is serving, added by end_headers
+    max_age = None
+
+    def not_modified(self, etag):
+        """
+        Answer 304 Not Modified if the browser's cached copy matches etag.
+        Returns True when the response has been sent.
+        """
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        if etag not in tags and '*' not in tags:
+            return False
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.end_headers()
+        return True
+
     def do_GET(self):
         # Parse the URL
         parsed_path = urlparse(self.path)
         path = unquote(parsed_path.path.lstrip('/'))
 
+        # Serve the player page from the render cache so it reflects current progress
+        if path in ('', 'index.html'):
+            root_dir = os.getcwd()
+            html = render_index(root_dir, os.path.basename(root_dir))
+            etag = _bytes_etag(html)
+            if self.not_modified(etag):
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', len(html))
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(html)
+            return
+
+        # API: Current watched list, used by the page to resync
+        if path == 'api/progress':
+            with _PROGRESS_LOCK:
+                body = json_dumps({'watched': sorted(get_watched())}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', len(body))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        # Styles the page loads after first paint
+        if path == 'static/deferred.css':
+            if self.not_modified(_DEFERRED_STYLE_ETAG):
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/css; charset=utf-8')
+            self.send_header('Content-Length', len(_DEFERRED_STYLE))
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', _DEFERRED_STYLE_ETAG)
+            self.end_headers()
+            self.wfile.write(_DEFERRED_STYLE)
+            return
+
         # Check if it's a subtitle file
         if path.lower().endswith('.srt'):
             # Convert SRT to VTT on the fly
             file_path = os.path.join(os.getcwd(), path)
             if os.path.exists(file_path):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        srt_content = f.read()
-
-                    vtt_content = srt_to_vtt(srt_content)
-
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'text/vtt; charset=utf-8')
-                    self.send_header('Content-Length', len(vtt_content.encode('utf-8')))
-                    self.send_header('Accept-Ranges', 'bytes')
-                    self.end_headers()
-                    self.wfile.write(vtt_content.encode('utf-8'))
+                    st = os.stat(file_path)
+                    etag = _file_etag(st)
+                    if self.not_modified(etag):
+                        return
+
+                    if st.st_size > _SRT_CACHE_MAX_SIZE:
+                        with open(file_path, 'r', encoding='utf-8') as f:
+                            self.send_vtt_headers(st, etag)
+                            self.stream_srt_as_vtt(f)
+                        return
+
+                    vtt_content = _converted_srt(file_path, st.st_mtime_ns, st.st_size)
+                    self.send_vtt_headers(st, etag, len(vtt_content))
+                    self.wfile.write(vtt_content)
                     return
                 except Exception as e:
                     print(f"Error converting SRT to VTT: {e}")
@@ -2348,6 +3206,38 @@ class CourseHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         # Default behavior for other files
         super().do_GET()
     
+    def send_vtt_headers(self, st, etag, length=None):
+        """
+        Send the 200 response headers for a subtitle converted from SRT.
+        Without a length, the body ends when the connection closes (the
+        handler speaks HTTP/1.0, which closes after every response).
+        """
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/vtt; charset=utf-8')
+        if length is not None:
+            self.send_header('Content-Length', length)
+        self.send_header('Cache-Control', f"max-age={_MAX_AGE_BY_EXT['.srt']}")
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+        self.end_headers()
+
+    def stream_srt_as_vtt(self, f):
+        """
+        Convert an open SRT file to WebVTT while sending it, a block of whole
+        lines at a time, so the first cues go out before the file is read.
+        """
+        try:
+            self.wfile.write(b"WEBVTT\n\n")
+            while True:
+                lines = f.readlines(_SRT_STREAM_BLOCK)
+                if not lines:
+                    break
+                block = _SRT_TIMESTAMP_COMMA.sub('.', ''.join(lines))
+                self.wfile.write(block.encode('utf-8'))
+        except Exception as e:
+            # Headers are already sent, so there is no error response to give
+            print(f"Error streaming SRT as VTT: {e}")
+
     def do_POST(self):
         """
         Handle POST requests for progress tracking API.
@@ -2378,24 +3268,24 @@ class CourseHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             else:
                 self.send_error(400, "Missing 'path' parameter")
         
-        # API: Toggle watched status
+        # API: Toggle watched status, or set it when 'watched' is given
+        # (the page sends the state it switched to, so repeats are harmless)
         elif path == '/api/toggle_watched':
             video_path = data.get('path', '')
             if video_path:
-                watched = load_progress()
-                normalized_path = video_path.replace('\\', '/')
-                
-                if normalized_path in watched:
-                    remove_progress(video_path)
-                    is_watched = False
+                if 'watched' in data:
+                    now_watched = bool(data['watched'])
+                    if now_watched:
+                        save_progress(video_path)
+                    else:
+                        remove_progress(video_path)
                 else:
-                    save_progress(video_path)
-                    is_watched = True
+                    now_watched = toggle_progress(video_path)
                 
                 self.send_response(200)
                 self.send_header('Content-Type', 'application/json')
                 self.end_headers()
-                response = json.dumps({'success': True, 'watched': is_watched, 'path': video_path})
+                response = json.dumps({'success': True, 'watched': now_watched, 'path': video_path})
                 self.wfile.write(response.encode('utf-8'))
             else:
                 self.send_error(400, "Missing 'path' parameter")
@@ -2412,10 +3302,94 @@ class CourseHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         else:
             self.send_error(404, "API endpoint not found")
 
+    def send_head(self):
+        """
+        Like SimpleHTTPRequestHandler.send_head, but honours single byte
+        Range requests with a 206 response so the browser can seek inside
+        large videos without re-reading them from the start.
+        Course files also get a Cache-Control max-age by extension; the base
+        class already answers If-Modified-Since with 304.
+        """
+        self.byte_range = None
+        match = _RANGE_RE.match(self.headers.get('Range', '').strip())
+        path = self.translate_path(self.path)
+        is_file = os.path.isfile(path)
+        if is_file:
+            self.max_age = _MAX_AGE_BY_EXT.get(os.path.splitext(path)[1].lower())
+        if match:
+            first, last = match.groups()
+            # An invalid range ("bytes=-", "bytes=5-3") is ignored, per RFC 9110
+            if (not first and not last) or (first and last and int(first) > int(last)):
+                match = None
+        if not match or not is_file:
+            return super().send_head()
+
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        try:
+            fs = os.fstat(f.fileno())
+            size = fs.st_size
+            last_modified = self.date_time_string(fs.st_mtime)
+
+            # If-Range: the browser's partial copy is stale, so send it all
+            if_range = self.headers.get('If-Range')
+            if if_range and if_range not in (last_modified, _file_etag(fs)):
+                f.close()
+                return super().send_head()
+
+            first, last = match.groups()
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            else:
+                # Suffix range: the final N bytes
+                start = max(size - int(last), 0)
+                end = size - 1
+
+            if start >= size:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                f.close()
+                return None
+
+            self.send_response(206)
+            self.send_header('Content-Type', self.guess_type(path))
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+            self.send_header('Content-Length', str(end - start + 1))
+            self.send_header('Last-Modified', last_modified)
+            self.end_headers()
+            self.byte_range = (start, end - start + 1)
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        """
+        Send the file (or the requested byte range) with socket.sendfile,
+        which copies in the kernel where os.sendfile is available.
+        """
+        offset, count = getattr(self, 'byte_range', None) or (0, None)
+        outputfile.flush()
+        try:
+            self.connection.sendfile(source, offset, count)
+        except (BrokenPipeError, ConnectionResetError):
+            # The browser routinely drops video connections when seeking
+            pass
+
     def end_headers(self):
         # Add headers to support video streaming and CORS
         self.send_header('Accept-Ranges', 'bytes')
         self.send_header('Access-Control-Allow-Origin', '*')
+        if self.max_age is not None:
+            self.send_header('Cache-Control', f'max-age={self.max_age}')
+            self.max_age = None
         super().end_headers()
 
     def log_message(self, format, *args):
@@ -2429,7 +3403,8 @@ def start_server():
     """
     handler = CourseHTTPRequestHandler
 
-    with socketserver.TCPServer(("", PORT), handler) as httpd:
+    # One thread per request, so video streams don't block API calls
+    with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
         print(f"\n{'='*60}")
         print(f"🎓 Course Player Server Started")
         print(f"{'='*60}")
@@ -2482,11 +3457,11 @@ def main():
 
     # Generate HTML
     print("📝 Generating course player interface...")
-    html_content = generate_html(course_structure, course_name)
+    html_content = render_index(current_dir, course_name)
 
     # Write HTML file
     index_path = os.path.join(current_dir, 'index.html')
-    with open(index_path, 'w', encoding='utf-8') as f:
+    with open(index_path, 'wb') as f:
         f.write(html_content)
 
     print(f"✅ Generated: {index_path}\n")